@@ -100,8 +100,8 @@ async def get_history(
     limit: int = Query(DEFAULT_HISTORY_LIMIT, ge=1, le=500),
     manager: DownloadManager = Depends(get_download_manager),
 ):
-    history = manager.history_manager.get_history(limit)
-    return [dict(row) for row in history]
+    # get_history already returns plain dicts; return them without another copy.
+    return manager.history_manager.get_history(limit)
 
 
 @router.post("/api/resume")
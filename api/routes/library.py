@@ -11,6 +11,7 @@ from xml.etree import ElementTree as ET
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import FileResponse, Response, StreamingResponse
 
+from mr_banana.scraper.file_scanner import find_preview_files
 from mr_banana.utils.config import load_config
 from mr_banana.utils.network import DEFAULT_USER_AGENT
 
@@ -158,12 +159,10 @@ def _build_library_items(root: Path, max_items: int) -> list[dict]:
 
         preview_urls: list[str] = []
         try:
-            for p in sorted(nfo.parent.glob(f"{nfo.stem}-preview-*.*")):
+            for name in find_preview_files(nfo.parent, nfo.stem):
                 if len(preview_urls) >= 12:
                     break
-                if not p.is_file():
-                    continue
-                u = asset_url(p.name)
+                u = asset_url(name)
                 if u:
                     preview_urls.append(u)
         except Exception:
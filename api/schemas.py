@@ -90,6 +90,7 @@ class ScrapeConfigRequest(BaseModel):
     scrape_download_previews: bool | None = None
     scrape_download_trailer: bool | None = None
     scrape_download_subtitle: bool | None = None
+    scrape_skip_existing_artwork: bool | None = None
     scrape_subtitle_languages: List[str] | None = None
     scrape_preview_limit: int | None = None
     scrape_nfo_fields: List[str] | None = None
@@ -9,7 +9,7 @@ from pathlib import Path
 from urllib.parse import quote
 from dataclasses import dataclass
 
-from mr_banana.utils.config import AppConfig, load_config, save_config
+from mr_banana.utils.config import _FIELD_NAMES, AppConfig, load_config, save_config
 from mr_banana.utils.logger import logger, LOGS_DIR
 
 from api.log_utils import read_log_file
@@ -302,6 +302,7 @@ class ScrapeManager:
             "scrape_download_previews": bool(cfg.scrape_download_previews),
             "scrape_download_trailer": bool(cfg.scrape_download_trailer),
             "scrape_download_subtitle": bool(cfg.scrape_download_subtitle),
+            "scrape_skip_existing_artwork": bool(cfg.scrape_skip_existing_artwork),
             "scrape_subtitle_languages": list(cfg.scrape_subtitle_languages or []),
             "scrape_preview_limit": int(cfg.scrape_preview_limit or 8),
             "scrape_nfo_fields": list(cfg.scrape_nfo_fields or []),
@@ -322,11 +323,12 @@ class ScrapeManager:
     def set_config(self, **updates) -> dict:
         cfg = load_config()
 
-        # Only set known attributes to keep config stable.
+        # Only set known fields to keep config stable (AppConfig has slots, so methods
+        # and class attributes can't be shadowed per instance).
         for k, v in (updates or {}).items():
             if v is None:
                 continue
-            if hasattr(cfg, k):
+            if k in _FIELD_NAMES:
                 setattr(cfg, k, v)
 
         save_config(cfg)
@@ -11,6 +11,7 @@ from pathlib import Path
 from urllib.parse import quote
 from typing import TYPE_CHECKING
 
+from mr_banana.scraper.file_scanner import find_preview_files
 from mr_banana.utils.config import AppConfig, load_config
 from mr_banana.utils.logger import logger
 
@@ -177,6 +178,13 @@ def run_scrape_worker(mgr: ScrapeManager, job_id: int) -> None:
             job.status = "Failed"
             job.completed_at = time.time()
             mgr._persist_jobs_to_disk_locked()
+    finally:
+        # Flush per-crawler caches (e.g. conditional-GET ETags) and release sessions.
+        for c in crawlers:
+            try:
+                c.close()
+            except Exception:
+                pass
 
 
 # ---------------------------------------------------------------------------
@@ -280,6 +288,7 @@ def _build_scrape_options(cfg: AppConfig, proxy_url: str, field_sources: dict, i
         "download_previews": bool(cfg.scrape_download_previews),
         "download_trailer": bool(cfg.scrape_download_trailer),
         "download_subtitle": bool(cfg.scrape_download_subtitle),
+        "skip_existing_artwork": bool(cfg.scrape_skip_existing_artwork),
         "subtitle_languages": list(cfg.scrape_subtitle_languages or []),
         "preview_limit": int(cfg.scrape_preview_limit or 8),
         "nfo_fields": list(cfg.scrape_nfo_fields or []),
@@ -345,9 +354,7 @@ def _result_to_item(r, out_root: Path | None) -> dict:
             preview_files = data.get("preview_files") or []
             if not preview_files:
                 try:
-                    preview_files = sorted(
-                        [p.name for p in pdir.glob(f"{video_stem}-preview-*.*") if p.is_file()]
-                    )
+                    preview_files = find_preview_files(pdir, video_stem)
                 except Exception:
                     preview_files = []
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import re
+import json
+import os
+import threading
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -8,9 +10,64 @@ from typing import Any, Callable
 
 from curl_cffi import requests
 
-from mr_banana.utils.network import DEFAULT_USER_AGENT, build_proxies, apply_curl_dns_resolve
+from mr_banana.utils.history import cache_path
+from mr_banana.utils.network import DEFAULT_USER_AGENT, build_proxies, apply_curl_dns_resolve, tls_verify
 from ..types import CrawlResult, MediaInfo
 
+# Conditional-GET cache: URL -> (ETag, parsed JSON payload). Bounded so that a
+# large library rescan doesn't grow the on-disk file without limit.
+_ETAG_CACHE_MAX_ENTRIES = 500
+_etag_file_lock = threading.Lock()
+
+
+def _read_etag_file(path: Path) -> dict[str, tuple[str, dict]]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    out: dict[str, tuple[str, dict]] = {}
+    if isinstance(raw, dict):
+        for url, entry in raw.items():
+            if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], str) and isinstance(entry[1], dict):
+                out[str(url)] = (entry[0], entry[1])
+    return out
+
+
+_ASCII_LETTERS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+_ASCII_DIGITS = frozenset("0123456789")
+_PREFIX_CHARS = _ASCII_LETTERS | _ASCII_DIGITS | frozenset("._-")
+
+
+def _scan_code(stem: str, *, hyphen: bool) -> tuple[str, str] | None:
+    """Find the first ``LETTERS[-]DIGITS`` code in stem with a single linear scan.
+
+    Equivalent to ``(?<![A-Za-z])([A-Za-z]{2,6})-?([0-9]{2,5})(?=[^0-9]|$)`` (hyphen
+    required when ``hyphen`` is True, absent otherwise) without regex backtracking:
+    each maximal ASCII letter run is checked once for a 2-6 length and a 2-5 digit
+    run after the optional hyphen.
+    """
+    n = len(stem)
+    i = 0
+    while i < n:
+        if stem[i] not in _ASCII_LETTERS:
+            i += 1
+            continue
+        j = i
+        while j < n and stem[j] in _ASCII_LETTERS:
+            j += 1
+        k = j
+        if 2 <= j - i <= 6:
+            if hyphen:
+                k = j + 1 if j < n and stem[j] == "-" else -1
+            if k != -1:
+                d = k
+                while d < n and stem[d] in _ASCII_DIGITS:
+                    d += 1
+                if 2 <= d - k <= 5:
+                    return stem[i:j], stem[k:d]
+        i = j
+    return None
+
 
 def extract_jav_code(file_path: Path) -> str | None:
     """
@@ -27,18 +84,16 @@ def extract_jav_code(file_path: Path) -> str | None:
         return None
 
     # Clean up common prefixes like "4k2.me@", "xxx@", etc.
-    stem = re.sub(r'^[A-Za-z0-9._-]*@', '', stem)
+    head, sep, tail = stem.partition("@")
+    if sep and all(c in _PREFIX_CHARS for c in head):
+        stem = tail
 
-    # Pattern: 2-6 letters + hyphen + 2-5 digits (ignore suffix like -C, ch, etc.)
+    # 2-6 letters + hyphen + 2-5 digits (ignore suffix like -C, ch, etc.)
     # Examples: ADN-529-C -> ADN-529, ADN-748ch -> ADN-748
-    match = re.search(r'(?<![A-Za-z])([A-Za-z]{2,6})-(\d{2,5})(?=[^0-9]|$)', stem, re.IGNORECASE)
-    if match:
-        return f"{match.group(1).upper()}-{match.group(2)}"
-
-    # Pattern without hyphen: ABC123, adn529 -> ADN-529
-    match = re.search(r'(?<![A-Za-z])([A-Za-z]{2,6})(\d{2,5})(?=[^0-9]|$)', stem, re.IGNORECASE)
-    if match:
-        return f"{match.group(1).upper()}-{match.group(2)}"
+    # Then without hyphen: ABC123, adn529 -> ADN-529
+    found = _scan_code(stem, hyphen=True) or _scan_code(stem, hyphen=False)
+    if found:
+        return f"{found[0].upper()}-{found[1]}"
 
     return None
 
@@ -51,7 +106,13 @@ class BaseCrawler(ABC):
     def __init__(self, cfg: Any = None, log_fn: Callable[[str], None] | None = None):
         self.cfg = cfg
         self._log = log_fn
-        self._session = requests.Session()
+        # Verification is configured once on the session so that curl can reuse
+        # TLS sessions across requests to the same host.
+        self._session = requests.Session(verify=tls_verify())
+        # One crawler instance is shared by the crawl pool's threads.
+        self._etag_lock = threading.Lock()
+        self._etag: dict[str, tuple[str, dict]] | None = None
+        self._etag_dirty = False
 
     # -- Logging --
 
@@ -83,26 +144,33 @@ class BaseCrawler(ABC):
         return {"User-Agent": DEFAULT_USER_AGENT}
 
     def _request(
-        self, url: str, *, cookies: dict[str, str] | None = None
+        self, url: str, *, cookies: dict[str, str] | None = None, etag: str | None = None
     ) -> requests.Response | None:
         """Perform a GET request with logging, delay, DNS resolve, and proxy.
 
-        Returns the Response on HTTP 200, or None on failure / non-200 status.
+        When ``etag`` is given it is sent as ``If-None-Match`` and a 304 response
+        is returned as-is so the caller can reuse its cached payload.
+
+        Returns the Response on HTTP 200 (or 304 when ``etag`` is set), or None on failure.
         """
         try:
             self._emit(f"GET {url}")
             self._apply_delay()
             apply_curl_dns_resolve(self._session, url)
+            headers = self._headers()
+            if etag:
+                headers["If-None-Match"] = etag
             r = self._session.get(
                 url,
-                headers=self._headers(),
+                headers=headers,
                 cookies=cookies,
                 timeout=25,
-                verify=False,
                 impersonate="chrome",
                 proxies=self._build_proxies(),
             )
             self._emit(f"<- {r.status_code} {url}")
+            if r.status_code == 304 and etag:
+                return r
             if r.status_code != 200:
                 return None
             return r
@@ -116,9 +184,78 @@ class BaseCrawler(ABC):
         return r.text if r is not None else None
 
     def _get_json(self, url: str) -> dict | None:
-        """GET url, return parsed JSON dict or None."""
-        r = self._request(url)
-        return r.json() if r is not None else None
+        """GET url, return parsed JSON dict or None.
+
+        Honors upstream ETags: an unchanged payload comes back as a bodiless 304
+        and is served from the conditional-GET cache.
+        """
+        cached = self._etag_lookup(url)
+        r = self._request(url, etag=cached[0] if cached else None)
+        if r is None:
+            return None
+        if r.status_code == 304 and cached:
+            return cached[1]
+        payload = r.json()
+        self._etag_store(url, r, payload)
+        return payload
+
+    # -- Conditional-GET cache --
+
+    def _etag_lookup(self, url: str) -> tuple[str, dict] | None:
+        with self._etag_lock:
+            return self._etag_map().get(url)
+
+    def _etag_map(self) -> dict[str, tuple[str, dict]]:
+        """Load the cache on first use. Caller must hold ``_etag_lock``."""
+        if self._etag is None:
+            with _etag_file_lock:
+                self._etag = _read_etag_file(cache_path("http_etag.json"))
+        return self._etag
+
+    def _etag_store(self, url: str, r: requests.Response, payload: Any) -> None:
+        etag = r.headers.get("ETag")
+        if not etag or not isinstance(payload, dict):
+            return
+        with self._etag_lock:
+            cache = self._etag_map()
+            cache.pop(url, None)
+            cache[url] = (etag, payload)
+            self._etag_dirty = True
+
+    def close(self) -> None:
+        """Persist the conditional-GET cache and release the HTTP session."""
+        self.save_etag_cache()
+        session = getattr(self, "_session", None)
+        if session is not None:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+    def save_etag_cache(self) -> None:
+        """Merge new conditional-GET entries into the on-disk cache (no-op when unchanged)."""
+        entries: list[tuple[str, tuple[str, dict]]] = []
+        if getattr(self, "_etag_dirty", False):
+            # Snapshot under the lock; pool threads may still be storing entries.
+            with self._etag_lock:
+                entries = list(self._etag.items()) if self._etag else []
+                self._etag_dirty = False
+        if entries:
+            path = cache_path("http_etag.json")
+            try:
+                with _etag_file_lock:
+                    merged = _read_etag_file(path)
+                    for url, entry in entries:
+                        merged.pop(url, None)
+                        merged[url] = entry
+                    if len(merged) > _ETAG_CACHE_MAX_ENTRIES:
+                        merged = dict(list(merged.items())[-_ETAG_CACHE_MAX_ENTRIES:])
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = path.with_suffix(".tmp")
+                    tmp.write_text(json.dumps(merged, ensure_ascii=False), encoding="utf-8")
+                    os.replace(tmp, path)
+            except Exception as e:
+                self._emit(f"!! etag cache write failed: {e}")
 
     # -- Abstract --
 
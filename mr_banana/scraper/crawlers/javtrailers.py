@@ -5,8 +5,6 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
-from curl_cffi import requests
-
 from mr_banana.utils.network import DEFAULT_USER_AGENT
 from ..text_utils import derive_dmm_artwork, normalize_release_date
 from ..types import CrawlResult, MediaInfo
@@ -79,23 +77,12 @@ class JavtrailersCrawler(BaseCrawler):
     def _fetch_video_api(self, content_id: str) -> dict | None:
         """Fetch video data from javtrailers API. Returns parsed JSON or None."""
         api_url = f"{self.cfg.base_url}/api/video/{content_id}"
-        self._emit(f"GET {api_url}")
-        try:
-            r = requests.get(
-                api_url,
-                headers=self._headers(),
-                timeout=25,
-                verify=False,
-                impersonate="chrome",
-                proxies=self._build_proxies(),
-            )
-        except Exception as e:
-            self._emit(f"!! request error {api_url}: {e}")
-            return None
-
-        self._emit(f"<- {r.status_code} {api_url}")
-        if r.status_code != 200:
+        cached = self._etag_lookup(api_url)
+        r = self._request(api_url, etag=cached[0] if cached else None)
+        if r is None:
             return None
+        if r.status_code == 304 and cached:
+            return cached[1]
 
         raw_text = getattr(r, "text", None) or ""
         if self._is_cf_challenge_html(raw_text):
@@ -105,6 +92,7 @@ class JavtrailersCrawler(BaseCrawler):
         try:
             payload = json.loads(raw_text)
             if isinstance(payload, dict) and isinstance(payload.get("video"), dict):
+                self._etag_store(api_url, r, payload)
                 return payload
         except Exception:
             pass
@@ -119,8 +107,6 @@ class JavtrailersCrawler(BaseCrawler):
         if not content_id:
             return None
 
-        self._apply_delay()
-
         # Try without prefix first, then with "1" prefix (DMM convention for some videos)
         payload = self._fetch_video_api(content_id)
         used_content_id = content_id
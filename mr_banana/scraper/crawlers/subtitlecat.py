@@ -6,7 +6,7 @@ from urllib.parse import urljoin
 
 from curl_cffi import requests
 
-from mr_banana.utils.network import DEFAULT_USER_AGENT, build_proxies
+from mr_banana.utils.network import DEFAULT_USER_AGENT, build_proxies, tls_verify
 from ..types import CrawlResult, MediaInfo
 from .base import BaseCrawler
 
@@ -23,6 +23,9 @@ class SubtitleCatCrawler(BaseCrawler):
     def __init__(self, proxy_url: str | None = None, log_fn=None):
         self.proxy_url = proxy_url
         self._log = log_fn
+        # Search, detail and download requests all hit subtitlecat.com; one session
+        # keeps the connection alive across them and across files.
+        self._session = requests.Session(verify=tls_verify())
 
     def _emit(self, msg: str) -> None:
         if self._log:
@@ -65,7 +68,7 @@ class SubtitleCatCrawler(BaseCrawler):
         params = {"search": keyword}
 
         try:
-            r = requests.get(
+            r = self._session.get(
                 search_url, 
                 params=params, 
                 headers=self._headers(), 
@@ -115,7 +118,7 @@ class SubtitleCatCrawler(BaseCrawler):
 
     def _process_detail_page(self, url: str, save_path_base: Path, languages: list[str] | None) -> list[Path]:
         try:
-            r = requests.get(
+            r = self._session.get(
                 url, 
                 headers=self._headers(), 
                 impersonate="chrome", 
@@ -200,7 +203,7 @@ class SubtitleCatCrawler(BaseCrawler):
     def _download_file(self, url: str, path: Path) -> bool:
         self._emit(f"subtitlecat: downloading {url} -> {path.name}")
         try:
-            r = requests.get(
+            r = self._session.get(
                 url, 
                 headers=self._headers(), 
                 impersonate="chrome", 
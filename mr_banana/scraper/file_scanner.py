@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 
@@ -11,13 +12,43 @@ def scan_videos(root_dir: str | Path, recursive: bool = True) -> list[Path]:
     if not root.exists() or not root.is_dir():
         return []
 
-    it = root.rglob("*") if recursive else root.glob("*")
+    # os.scandir answers is_dir()/is_file() from the directory entry type, so the walk
+    # costs one syscall batch per directory instead of a stat() per entry.
+    # Like rglob, symlinked directories are not descended into; unreadable ones are skipped.
     files: list[Path] = []
-    for p in it:
-        if not p.is_file():
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                entries = list(it)
+        except OSError:
             continue
-        if p.suffix.lower() in VIDEO_EXTS:
-            files.append(p)
+        for e in entries:
+            try:
+                if recursive and e.is_dir(follow_symlinks=False):
+                    stack.append(d / e.name)
+                elif os.path.splitext(e.name)[1].lower() in VIDEO_EXTS and e.is_file():
+                    files.append(d / e.name)
+            except OSError:
+                continue
 
     files.sort(key=lambda x: x.as_posix().lower())
     return files
+
+
+def find_preview_files(directory: str | Path, stem: str) -> list[str]:
+    """Sorted names of files matching ``{stem}-preview-*.*`` in ``directory``.
+
+    A prefix test over one scandir pass; unlike glob it builds no pattern per call
+    and treats glob metacharacters in ``stem`` literally.
+    """
+    prefix = f"{stem}-preview-"
+    names = []
+    with os.scandir(directory) as it:
+        for e in it:
+            n = e.name
+            if n.startswith(prefix) and "." in n[len(prefix):] and e.is_file():
+                names.append(n)
+    names.sort()
+    return names
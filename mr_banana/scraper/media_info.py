@@ -2,31 +2,132 @@ from __future__ import annotations
 
 import json
 import os
+import sqlite3
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from mr_banana.utils import fastjson
+from mr_banana.utils.history import cache_path
+
 from .types import MediaInfo
 
 
+def _ffprobe_max() -> int:
+    """MR_BANANA_FFPROBE_MAX as a positive int; anything unparsable falls back to 4."""
+    try:
+        return max(1, int(os.getenv("MR_BANANA_FFPROBE_MAX", "") or 4))
+    except ValueError:
+        return 4
+
+
+# Cap concurrent ffprobe children so parallel scrapes don't fork-bomb the host.
+_FFPROBE_SEMAPHORE = threading.Semaphore(_ffprobe_max())
+
+
+# Probe results keyed by (path, mtime_ns, size): an unchanged library rescan
+# becomes a stat() + primary-key lookup per file instead of a probe.
+_probe_cache_lock = threading.Lock()
+_probe_cache_conn: sqlite3.Connection | None = None
+_probe_cache_failed = False
+
+
+def _probe_cache_path() -> Path:
+    override = os.environ.get("MR_BANANA_PROBE_CACHE", "")
+    if override:
+        return Path(override).expanduser()
+    return cache_path("probe.sqlite")
+
+
+def _probe_cache() -> sqlite3.Connection | None:
+    """Open the probe cache lazily. Caller must hold ``_probe_cache_lock``."""
+    global _probe_cache_conn, _probe_cache_failed
+    if _probe_cache_conn is not None or _probe_cache_failed:
+        return _probe_cache_conn
+    try:
+        path = _probe_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), check_same_thread=False)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS probe (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER,
+                size INTEGER,
+                duration REAL,
+                width INTEGER,
+                height INTEGER
+            )
+            """
+        )
+        conn.commit()
+        _probe_cache_conn = conn
+    except Exception:
+        _probe_cache_failed = True
+    return _probe_cache_conn
+
+
+def _probe_cache_get(path: Path, st: os.stat_result) -> tuple[float | None, int | None, int | None] | None:
+    with _probe_cache_lock:
+        conn = _probe_cache()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT mtime_ns, size, duration, width, height FROM probe WHERE path = ?",
+                (str(path),),
+            ).fetchone()
+        except Exception:
+            return None
+    if row is None or row[0] != st.st_mtime_ns or row[1] != st.st_size:
+        return None
+    return row[2], row[3], row[4]
+
+
+def _probe_cache_put(
+    path: Path, st: os.stat_result, probed: tuple[float | None, int | None, int | None]
+) -> None:
+    with _probe_cache_lock:
+        conn = _probe_cache()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO probe (path, mtime_ns, size, duration, width, height) VALUES (?, ?, ?, ?, ?, ?)",
+                (str(path), st.st_mtime_ns, st.st_size, *probed),
+            )
+            conn.commit()
+        except Exception:
+            pass
+
+
 def _ffprobe(path: Path) -> dict | None:
     """Return ffprobe JSON output, or None if ffprobe fails/unavailable."""
     try:
-        proc = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-print_format",
-                "json",
-                "-show_format",
-                "-show_streams",
-                str(path),
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=False,
-            timeout=20,
-        )
+        with _FFPROBE_SEMAPHORE:
+            proc = subprocess.run(
+                [
+                    "ffprobe",
+                    "-v",
+                    "error",
+                    # Parallelize across files, not inside a single probe.
+                    "-threads",
+                    "1",
+                    # Only the fields read_media_info uses.
+                    "-select_streams",
+                    "v:0",
+                    "-show_entries",
+                    "stream=width,height:format=duration",
+                    "-print_format",
+                    "json",
+                    str(path),
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,  # never read; avoid buffering it
+                check=False,
+                timeout=20,
+            )
     except FileNotFoundError:
         return None
     except subprocess.TimeoutExpired:
@@ -35,44 +136,78 @@ def _ffprobe(path: Path) -> dict | None:
     if proc.returncode != 0:
         return None
 
+    # Bytes parse directly; only fall back to a lossy decode for non-UTF-8 output.
     try:
-        return json.loads(proc.stdout.decode("utf-8", errors="replace"))
+        return fastjson.loads(proc.stdout)
+    except UnicodeDecodeError:
+        pass
     except Exception:
         return None
-
-
-def read_media_info(path: str | Path) -> MediaInfo:
-    p = Path(path)
-    info = MediaInfo(path=p)
-
     try:
-        info.size_bytes = p.stat().st_size
+        return json.loads(proc.stdout.decode("utf-8", errors="replace"))
     except Exception:
-        info.size_bytes = None
+        return None
+
 
-    data = _ffprobe(p)
+def _probe(path: Path) -> tuple[float | None, int | None, int | None] | None:
+    """Return (duration, width, height), or None when the file can't be probed."""
+    data = _ffprobe(path)
     if not data:
-        return info
+        return None
+
+    duration = width = height = None
 
     # duration
     try:
         fmt = data.get("format") or {}
         if fmt.get("duration") is not None:
-            info.duration_seconds = float(fmt["duration"])
+            duration = float(fmt["duration"])
     except Exception:
         pass
 
-    # video stream resolution
+    # video stream resolution (only v:0 is selected)
     try:
         streams = data.get("streams") or []
-        for s in streams:
-            if s.get("codec_type") == "video":
-                if s.get("width") is not None:
-                    info.width = int(s["width"])
-                if s.get("height") is not None:
-                    info.height = int(s["height"])
-                break
+        if streams:
+            s = streams[0]
+            if s.get("width") is not None:
+                width = int(s["width"])
+            if s.get("height") is not None:
+                height = int(s["height"])
     except Exception:
         pass
 
+    return duration, width, height
+
+
+def read_media_info(path: str | Path) -> MediaInfo:
+    p = Path(path)
+    info = MediaInfo(path=p)
+
+    try:
+        st = p.stat()
+        info.size_bytes = st.st_size
+    except Exception:
+        st = None
+        info.size_bytes = None
+
+    probed = _probe_cache_get(p, st) if st is not None else None
+    if probed is None:
+        probed = _probe(p)
+        if probed is None:
+            return info
+        if st is not None:
+            _probe_cache_put(p, st, probed)
+
+    info.duration_seconds, info.width, info.height = probed
     return info
+
+
+def read_media_info_many(paths) -> list[MediaInfo]:
+    """Probe many files concurrently; results keep the order of ``paths``."""
+    items = list(paths)
+    if len(items) <= 1:
+        return [read_media_info(p) for p in items]
+    workers = min(8, os.cpu_count() or 1, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(read_media_info, items))
@@ -10,6 +10,10 @@ from .text_utils import (
 )
 from .types import CrawlResult
 
+_RE_CODE = re.compile(r"[A-Za-z0-9]+-[A-Za-z0-9]+")
+_URL_SCHEMES = ("http://", "https://")
+# Returned by getters for absent keys so the pick loop can skip them with an identity test.
+_MISSING = object()
 
 _DEFAULT_FIELD_SOURCE_PRIORITY: dict[str, list[str]] = {
     "title": ["javtrailers"],
@@ -35,32 +39,29 @@ def _field_disabled(field: str, field_sources: dict[str, list[str]] | None) -> b
     return isinstance(v, list) and len(v) == 0
 
 
-def _rank_for(field: str, source: str, field_sources: dict[str, list[str]] | None = None) -> int:
-    selected: list[str] = []
-    if field_sources and isinstance(field_sources.get(field), list):
-        selected = list(field_sources.get(field) or [])
+def _rank_map(field: str, field_sources: dict[str, list[str]] | None = None) -> dict[str, int]:
+    """Return source -> rank for a field; sources not listed rank last (10_000).
 
-    # Semantics (no fallback):
-    # - If user selected providers for a field, try them in order.
-    # - If user selected none (empty list), the field is considered disabled.
-    # - If field is not present in field_sources, fall back to default priority.
-    pref: list[str] | None
+    Semantics (no fallback):
+    - If user selected providers for a field, try them in order.
+    - If user selected none (empty list), the field is considered disabled.
+    - If field is not present in field_sources, fall back to default priority.
+    """
     if field_sources and field in field_sources:
-        pref = list(selected)
+        pref = field_sources.get(field)
+        if not isinstance(pref, list):
+            pref = []
     else:
-        pref = _DEFAULT_FIELD_SOURCE_PRIORITY.get(field)
-
-    if not pref:
-        return 10_000
-    try:
-        return pref.index(source)
-    except ValueError:
-        return 10_000
+        pref = _DEFAULT_FIELD_SOURCE_PRIORITY.get(field) or []
+    rank: dict[str, int] = {}
+    for i, src in enumerate(pref):
+        rank.setdefault(src, i)
+    return rank
 
 
 def _is_probably_code(s: str) -> bool:
     t = (s or "").strip()
-    return bool(re.fullmatch(r"[A-Za-z0-9]+-[A-Za-z0-9]+", t))
+    return bool(_RE_CODE.fullmatch(t))
 
 
 def _valid_url(s: object) -> str | None:
@@ -69,25 +70,72 @@ def _valid_url(s: object) -> str | None:
     t = s.strip()
     if not t:
         return None
-    if t.startswith("http://") or t.startswith("https://"):
+    if t.startswith(_URL_SCHEMES):
         return t
     return None
 
 
-def _pick_by_priority(results: list[CrawlResult], field: str, getter, field_sources: dict[str, list[str]] | None = None) -> object | None:
+def _is_empty(v: object) -> bool:
+    """True for None, "", [] and {}; other falsy values (0, False) count as present."""
+    if v is None:
+        return True
+    if isinstance(v, (str, list, dict)):
+        return not v
+    return False
+
+
+def _ranks_for(
+    results: list[CrawlResult],
+    field: str,
+    field_sources: dict[str, list[str]] | None,
+    rank_cache: dict[tuple[str, ...], list[int]] | None,
+) -> list[int]:
+    """Return each result's rank for the field's source priority (lower is better).
+
+    Fields sharing the same effective priority list share one vector via ``rank_cache``.
+    """
+    rank = _rank_map(field, field_sources)
+    key = tuple(rank)
+    if rank_cache is not None:
+        ranks = rank_cache.get(key)
+        if ranks is not None:
+            return ranks
+    ranks = [rank.get(getattr(r, "source", ""), 10_000) for r in results]
+    if rank_cache is not None:
+        rank_cache[key] = ranks
+    return ranks
+
+
+def _pick_by_priority(
+    results: list[CrawlResult],
+    field: str,
+    getter,
+    field_sources: dict[str, list[str]] | None = None,
+    rank_cache: dict[tuple[str, ...], list[int]] | None = None,
+) -> object | None:
+    """Return the non-empty ``getter(i)`` with the best rank; ties go to crawler order.
+
+    Only the best value is needed, so this is a single linear scan (no sort) that
+    skips results which can't beat the current best and stops at a rank-0 hit.
+    """
     if _field_disabled(field, field_sources):
         return None
-    indexed = list(enumerate(results))
-    indexed.sort(key=lambda it: (_rank_for(field, getattr(it[1], "source", ""), field_sources), it[0]))
-    for _, r in indexed:
+    best_rank = 10_001
+    best = None
+    for i, rk in enumerate(_ranks_for(results, field, field_sources, rank_cache)):
+        if rk >= best_rank:
+            continue
         try:
-            v = getter(r)
+            v = getter(i)
         except Exception:
-            v = None
-        if v in (None, "") or v == [] or v == {}:
             continue
-        return v
-    return None
+        if v is _MISSING or _is_empty(v):
+            continue
+        best_rank, best = rk, v
+        if rk == 0:
+            break
+    return best
+
 
 def merge_results(results: list[CrawlResult], *, field_sources: dict[str, list[str]] | None = None) -> CrawlResult:
     """Merge multiple crawler results.
@@ -97,6 +145,10 @@ def merge_results(results: list[CrawlResult], *, field_sources: dict[str, list[s
     - Fallback to first-non-empty (crawler order) for any remaining fields.
     """
     merged = CrawlResult(source="merged")
+    # Most fields share the default priority list, so ranks are computed once per distinct list.
+    rank_cache: dict[tuple[str, ...], list[int]] = {}
+    # Bind each result's data dict once; getters index into this list.
+    datas = [r.data if isinstance(r.data, dict) else {} for r in results]
 
     # External id + canonical url (keep simple and stable)
     for r in results:
@@ -109,8 +161,9 @@ def merge_results(results: list[CrawlResult], *, field_sources: dict[str, list[s
     picked_title = _pick_by_priority(
         results,
         "title",
-        lambda r: (r.title.strip() if isinstance(r.title, str) else None),
+        lambda i: (results[i].title.strip() if isinstance(results[i].title, str) else None),
         field_sources,
+        rank_cache,
     )
     if not _field_disabled("title", field_sources):
         if isinstance(picked_title, str) and picked_title.strip() and not _is_probably_code(picked_title):
@@ -123,15 +176,25 @@ def merge_results(results: list[CrawlResult], *, field_sources: dict[str, list[s
                     break
 
     # Per-field data selection
-    plot_val = _pick_by_priority(results, "plot", lambda r: (r.data or {}).get("plot"), field_sources)
+    plot_val = _pick_by_priority(results, "plot", lambda i: datas[i].get("plot", _MISSING), field_sources, rank_cache)
     if not _field_disabled("plot", field_sources):
-        if isinstance(plot_val, str) and plot_val.strip() and not _looks_bad_plot(plot_val):
+        # The fallback scan revisits the picked plot (and sources often share text),
+        # so each distinct plot string is classified once.
+        bad_plot: dict[str, bool] = {}
+
+        def is_bad_plot(v: str) -> bool:
+            verdict = bad_plot.get(v)
+            if verdict is None:
+                verdict = bad_plot[v] = _looks_bad_plot(v)
+            return verdict
+
+        if isinstance(plot_val, str) and plot_val.strip() and not is_bad_plot(plot_val):
             merged.data["plot"] = plot_val.strip()
         else:
             # If best-by-priority looks like meta/placeholder, try any other non-bad plot
-            for r in results:
-                v = (r.data or {}).get("plot")
-                if isinstance(v, str) and v.strip() and not _looks_bad_plot(v):
+            for data in datas:
+                v = data.get("plot")
+                if isinstance(v, str) and v.strip() and not is_bad_plot(v):
                     merged.data["plot"] = v.strip()
                     break
             else:
@@ -150,41 +213,46 @@ def merge_results(results: list[CrawlResult], *, field_sources: dict[str, list[s
     ):
         if _field_disabled(key, field_sources):
             continue
-        v = _pick_by_priority(results, key, lambda r, k=key: (r.data or {}).get(k), field_sources)
-        if v not in (None, "") and v != [] and v != {}:
+        v = _pick_by_priority(results, key, lambda i, k=key: datas[i].get(k, _MISSING), field_sources, rank_cache)
+        if not _is_empty(v):
             merged.data[key] = v
 
     trailer = _pick_by_priority(
         results,
         "trailer_url",
-        lambda r: _valid_url((r.data or {}).get("trailer_url")),
+        lambda i: _valid_url(datas[i].get("trailer_url")),
         field_sources,
+        rank_cache,
     )
     if not _field_disabled("trailer_url", field_sources):
         if isinstance(trailer, str):
             merged.data["trailer_url"] = trailer
 
-    # Artwork fields
+    # Artwork fields (cover-derived DMM variants are computed once per result, not per getter)
+    covers = [_valid_url(d.get("cover_url")) for d in datas]
+    dmm_art = [_derive_dmm_artwork(c) for c in covers]
     poster = _pick_by_priority(
         results,
         "poster_url",
-        lambda r: (
-            _valid_url((r.data or {}).get("poster_url"))
-            or _derive_dmm_artwork(_valid_url((r.data or {}).get("cover_url")))[0]
-            or _valid_url((r.data or {}).get("cover_url"))
+        lambda i: (
+            _valid_url(datas[i].get("poster_url"))
+            or dmm_art[i][0]
+            or covers[i]
         ),
         field_sources,
+        rank_cache,
     )
     fanart = _pick_by_priority(
         results,
         "fanart_url",
-        lambda r: (
-            _valid_url((r.data or {}).get("fanart_url"))
-            or _derive_dmm_artwork(_valid_url((r.data or {}).get("cover_url")))[1]
+        lambda i: (
+            _valid_url(datas[i].get("fanart_url"))
+            or dmm_art[i][1]
         ),
         field_sources,
+        rank_cache,
     )
-    previews = _pick_by_priority(results, "preview_urls", lambda r: (r.data or {}).get("preview_urls"), field_sources)
+    previews = _pick_by_priority(results, "preview_urls", lambda i: datas[i].get("preview_urls", _MISSING), field_sources, rank_cache)
 
     if not _field_disabled("poster_url", field_sources):
         if isinstance(poster, str):
@@ -199,12 +267,11 @@ def merge_results(results: list[CrawlResult], *, field_sources: dict[str, list[s
             merged.data["preview_urls"] = previews
 
     # Fallback: fill remaining keys by first non-empty in crawler order.
-    for r in results:
-        for k, v in (r.data or {}).items():
-            if k in merged.data:
-                continue
-            if v in (None, "") or v == [] or v == {}:
-                continue
-            merged.data[k] = v
+    # Empties are never inserted, so setdefault only ever fills a genuinely missing key.
+    out = merged.data
+    for data in datas:
+        for k, v in data.items():
+            if not _is_empty(v):
+                out.setdefault(k, v)
 
     return merged
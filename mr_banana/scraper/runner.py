@@ -1,38 +1,122 @@
 from __future__ import annotations
 
+from mr_banana.utils import fastjson
 from mr_banana.utils.logger import logger
-from mr_banana.utils.translate import translate_text
+from mr_banana.utils.translate import supports_batch, translate_text, translate_text_batch
 
-import json
+import os
+import queue
 import re
 import shutil
+import string
 import threading
 import time
+import unicodedata
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .file_scanner import scan_videos
-from .media_info import read_media_info
+from .media_info import read_media_info, read_media_info_many
 from .merger import merge_results
-from .types import ScrapeItemResult
+from .types import MediaInfo, ScrapeItemResult
 from .writers.nfo import NfoWriteOptions, write_nfo
 from .crawlers.subtitlecat import SubtitleCatCrawler
 
+_RE_WS = re.compile(r"\s+")
+# Characters not allowed in path segments on common filesystems, mapped to "_".
+_FS_BAD_CHARS_TABLE = str.maketrans(dict.fromkeys('\\/:*?"<>|', "_"))
+# Per-run translation cache bound (oldest entry evicted first).
+_TRANSLATE_CACHE_MAX_ENTRIES = 4096
+# Translation batching: files per sequential slice / texts per coalesced threaded batch,
+# and how long a threaded worker waits for others to join its batch.
+_TRANSLATE_BATCH_SIZE = 32
+_TRANSLATE_BATCH_WAIT_SEC = 0.5
+
+# Plot guardrail: generic site slogans and JS/blocked placeholders (DMM often
+# returns these when blocked), matched in one scan over whitespace-collapsed,
+# lower-cased text.
+_SLOGAN_MARKERS = ("番号搜磁链", "管理你的成人影片", "分享你的想法")
+_PLACEHOLDER_MARKERS = (
+    "javascriptを有効",
+    "javascriptの設定方法",
+    "無料サンプル",
+    "サンプル動画",
+    "中古品",
+    "画像をクリックして拡大",
+    "拡大サンプル画像",
+    "请启用javascript",
+    "如何设置javascript",
+    "单击图像放大",
+)
+_RE_SLOGAN_MARKERS = re.compile("|".join(map(re.escape, _SLOGAN_MARKERS)))
+_RE_GUARD_MARKERS = re.compile("|".join(map(re.escape, _SLOGAN_MARKERS + _PLACEHOLDER_MARKERS)))
+# Plot guardrail: signals that a plot is a DMM/FANZA-style metadata blob.
+_RE_META_BRACKETS = re.compile(
+    r"[\[［]\s*(?:发布日期|时长)\s*[\]］]"
+    r"|【\s*(?:發行日期|发行日期|发布日期|長度|长度|时长)\s*】"
+)
+# Plot guardrail: leading metadata blocks / code / quoted title to strip.
+_RE_LEAD_BRACKET_RELEASE = re.compile(r"^\s*(?:\[|［)\s*发布日期\s*(?:\]|］)\s*[^，,]+\s*[，,]\s*")
+_RE_LEAD_BRACKET_LENGTH = re.compile(r"^\s*(?:\[|［)\s*时长\s*(?:\]|］)\s*\d+\s*分钟\s*[，,]\s*")
+_RE_LEAD_LENTICULAR_RELEASE = re.compile(r"^\s*【\s*(?:發行日期|发行日期|发布日期)\s*】\s*[^，,]+\s*[，,]\s*")
+_RE_LEAD_LENTICULAR_LENGTH = re.compile(r"^\s*【\s*(?:長度|长度|时长)\s*】\s*\d+\s*(?:分钟|分鐘)\s*[，,]\s*")
+_RE_LEAD_PAREN = re.compile(r"^[\(（]\s*(.*?)\s*[\)）]\s*")
+_RE_LEAD_CODE_PAREN = re.compile(r"^[\(（][A-Za-z0-9]+-[A-Za-z0-9]+[\)）]\s*")
+_RE_LEAD_QUOTED_TITLE = re.compile(r"^(?:“[^”]{5,300}”|「[^」]{5,300}」|『[^』]{5,300}』)\s*")
+
 
 def _sanitize_segment(value: str) -> str:
     s = (value or "").strip()
     if not s:
         return "Unknown"
-    s = re.sub(r"[\\/:*?\"<>|]", "_", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = s.translate(_FS_BAD_CHARS_TABLE)
+    s = _RE_WS.sub(" ", s).strip()
     return s[:120] if len(s) > 120 else s
 
 
+_STRUCTURE_FIELDS = frozenset({"actor", "year", "code", "title"})
+
+
+def _compile_structure(structure: str):
+    """Parse the output ``structure`` template once; returns ``fmt(actor, year, code, title)``.
+
+    Plain ``{field}`` templates become a join over pre-split parts. Anything fancier
+    (format specs, conversions, indexing, unknown fields) keeps using ``str.format``
+    so it behaves, and fails, exactly as before.
+    """
+    try:
+        parts = list(string.Formatter().parse(structure))
+    except ValueError:
+        parts = None
+    if parts is None or any(
+        name is not None and (name not in _STRUCTURE_FIELDS or spec or conv) for _, name, spec, conv in parts
+    ):
+        return lambda actor, year, code, title: structure.format(actor=actor, year=year, code=code, title=title)
+
+    def fmt(actor: str, year: str, code: str, title: str) -> str:
+        vals = {"actor": actor, "year": year, "code": code, "title": title}
+        return "".join(lit + vals[name] if name is not None else lit for lit, name, _, _ in parts)
+
+    return fmt
+
+
+def _mtime_or_none(p: Path) -> float | None:
+    try:
+        return os.stat(p).st_mtime
+    except OSError:
+        return None
+
+
 def _extract_year(release: str | None) -> str:
     if not release:
         return "Unknown"
-    m = re.search(r"(\d{4})", str(release))
-    return m.group(1) if m else "Unknown"
+    # First run of four decimal digits; str.isdecimal() matches exactly what \d does.
+    s = str(release)
+    for i in range(len(s) - 3):
+        w = s[i : i + 4]
+        if w.isdecimal():
+            return w
+    return "Unknown"
 
 
 def _avoid_collision(path: Path) -> Path:
@@ -48,8 +132,168 @@ def _avoid_collision(path: Path) -> Path:
     return path
 
 
+def _name_key(name: str) -> str:
+    """Directory-listing key that also matches on case-insensitive or normalizing filesystems."""
+    return unicodedata.normalize("NFC", name).casefold()
+
+
+def _listed(path: Path, keys: set[str]) -> bool:
+    """``path.exists()`` answered from ``_name_key``s of its parent's listing.
+
+    A miss needs no stat; a hit is confirmed with ``exists()`` so that case-sensitive
+    filesystems don't treat ``ABC.NFO`` as ``abc.nfo``.
+    """
+    return _name_key(path.name) in keys and path.exists()
+
+
 def _norm_ws(value: str) -> str:
-    return re.sub(r"\s+", " ", (value or "").strip())
+    return _RE_WS.sub(" ", (value or "").strip())
+
+
+def _strip_meta_prefix(t: str, code_hint: str) -> str:
+    """Strip DMM/FANZA-style leading metadata, (CODE) and quoted-title prefixes."""
+    # Strip leading metadata blocks.
+    for _ in range(3):
+        before = t
+        t = _RE_LEAD_BRACKET_RELEASE.sub("", t)
+        t = _RE_LEAD_BRACKET_LENGTH.sub("", t)
+        t = _RE_LEAD_LENTICULAR_RELEASE.sub("", t)
+        t = _RE_LEAD_LENTICULAR_LENGTH.sub("", t)
+        if t == before:
+            break
+    # Strip leading (CODE) (halfwidth/fullwidth parentheses)
+    if code_hint:
+        m = _RE_LEAD_PAREN.match(t)
+        if m and m.group(1).lower() == code_hint.lower():
+            t = t[m.end():]
+    t = _RE_LEAD_CODE_PAREN.sub("", t)
+    # Drop a quoted long title prefix if present.
+    t = _RE_LEAD_QUOTED_TITLE.sub("", t)
+    t = t.lstrip(" :：-—，,")
+    return _RE_WS.sub(" ", t).strip()
+
+
+def _apply_plot_guardrails(merged, log=None) -> None:
+    """Drop slogan/placeholder plots and clean metadata-prefixed ones, in place.
+
+    The plot is read and normalized once; slogan and placeholder markers are
+    found in a single scan. Debug lines are only built when ``log`` is given.
+    """
+    data = merged.data or {}
+    plot = data.get("plot")
+    if not isinstance(plot, str) or not plot.strip():
+        if log:
+            log("merged.plot(final)=<empty>")
+        return
+
+    t = plot.strip()
+    low = _RE_WS.sub(" ", t)
+    # Debug: show merged plot before any sanitization.
+    if log:
+        log(f"merged.plot(before)={low[:180]!r}")
+    low = low.lower()
+
+    m = _RE_GUARD_MARKERS.search(low)
+    if m:
+        data["plot"] = ""
+        merged.data = data
+        # Site slogans are dropped silently; any slogan outranks a placeholder hit.
+        if m.group(0) not in _SLOGAN_MARKERS and not _RE_SLOGAN_MARKERS.search(low, m.start()):
+            data.setdefault("plot_original", plot)
+            if log:
+                log("drop plot: placeholder/js-blocked")
+        if log:
+            log("merged.plot(final)=<empty>")
+        return
+
+    # Clean DMM/FANZA-style plot strings that include metadata prefix.
+    # Trigger on common signals; be tolerant of fullwidth brackets.
+    looks_like_meta = (
+        ("发布日期" in t and "时长" in t and "分钟" in t)
+        or ("發行日期" in t and "長度" in t and "分鐘" in t)
+        or bool(_RE_META_BRACKETS.search(t))
+    )
+    if looks_like_meta:
+        cleaned = _strip_meta_prefix(t, str(merged.external_id or "").strip())
+        if cleaned and cleaned != plot:
+            data.setdefault("plot_original", plot)
+            data["plot"] = cleaned
+            merged.data = data
+            if log:
+                log(f"merged.plot(sanitized)={cleaned[:180]!r}")
+
+    if not log:
+        return
+    # Debug: final plot that will be written to NFO (and then translated if enabled).
+    final_plot = data.get("plot")
+    if isinstance(final_plot, str) and final_plot.strip():
+        log(f"merged.plot(final)={_RE_WS.sub(' ', final_plot.strip())[:180]!r}")
+    else:
+        log("merged.plot(final)=<empty>")
+
+
+class _TranslateBatcher:
+    """Coalesce translate calls from worker threads into batched provider requests.
+
+    A caller queues its text and waits. Whichever waiter sees ``max_items`` texts
+    queued, or its own ``max_wait_sec`` deadline pass, sends the whole queue through
+    ``translate_many`` and wakes everyone.
+    """
+
+    def __init__(self, translate_many, *, max_items: int, max_wait_sec: float):
+        self._translate_many = translate_many
+        self._max_items = max_items
+        self._max_wait_sec = max_wait_sec
+        self._cond = threading.Condition()
+        self._pending: list[str] = []
+        self._done: dict[str, str | None] = {}
+        self._waiters: dict[str, int] = {}
+        self._flushing = False
+
+    def translate(self, text: str) -> str | None:
+        deadline = time.monotonic() + self._max_wait_sec
+        with self._cond:
+            self._waiters[text] = self._waiters.get(text, 0) + 1
+            if text not in self._done and text not in self._pending:
+                self._pending.append(text)
+            try:
+                while text not in self._done:
+                    if self._flushing:
+                        self._cond.wait()
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if len(self._pending) < self._max_items and remaining > 0:
+                        self._cond.wait(remaining)
+                        continue
+                    self._flush()
+                return self._done[text]
+            finally:
+                self._waiters[text] -= 1
+                if not self._waiters[text]:
+                    del self._waiters[text]
+                    self._done.pop(text, None)
+
+    def _flush(self) -> None:
+        """Translate the queued texts. Caller holds ``self._cond``; it is released during the request."""
+        batch, self._pending = self._pending, []
+        self._flushing = True
+        self._cond.release()
+        try:
+            out = self._translate_many(batch)
+        except Exception:
+            out = list(batch)
+        finally:
+            self._cond.acquire()
+            self._flushing = False
+        for i, text in enumerate(batch):
+            self._done[text] = out[i] if i < len(out) else text
+        self._cond.notify_all()
+
+
+def _source_name(rr) -> str:
+    # CrawlResult.source is always a str; only coerce anything else.
+    src = getattr(rr, "source", "")
+    return src if type(src) is str else str(src or "")
 
 
 def _infer_plot_source(per_file_results, merged_plot_norm: str) -> str:
@@ -60,7 +304,7 @@ def _infer_plot_source(per_file_results, merged_plot_norm: str) -> str:
             rp = (rr.data or {}).get("plot")
             rp_norm = _norm_ws(rp) if isinstance(rp, str) else ""
             if rp_norm and rp_norm == merged_plot_norm:
-                return str(getattr(rr, "source", "") or "")
+                return _source_name(rr)
         except Exception:
             continue
     return ""
@@ -89,7 +333,7 @@ def _emit_live_json(
             "code": str(merged.external_id or ""),
             "title": str(merged.title or ""),
             "url": str(merged.original_url or ""),
-            "hit_sources": [str(getattr(rr, "source", "") or "") for rr in per_file_results],
+            "hit_sources": list(map(_source_name, per_file_results)),
             "release": data.get("release"),
             "runtime": data.get("runtime"),
             "studio": data.get("studio"),
@@ -101,9 +345,9 @@ def _emit_live_json(
             "plot_len": len(plot_text) if plot_text else 0,
             "plot_source": plot_src,
             "plot_preview": plot_norm[:240] if plot_norm else "",
-            "subtitles": [str(p.name) for p in (subtitles or [])],
+            "subtitles": [p.name for p in subtitles] if subtitles else [],
         }
-        safe_log("live.json: " + json.dumps(live, ensure_ascii=False, separators=(",", ":")))
+        safe_log("live.json: " + fastjson.dumps_compact(live))
     except Exception:
         return
 
@@ -124,6 +368,7 @@ def scrape_directory(
     output_dir_raw = str(opts.get("output_dir") or "").strip()
     output_dir = Path(output_dir_raw).expanduser() if output_dir_raw else None
     structure = str(opts.get("structure") or "{actor}/{year}/{code}")
+    format_structure = _compile_structure(structure)
     rename = bool(opts.get("rename", True))
     copy_source = bool(opts.get("copy_source", True))
     threads = int(opts.get("threads", 1) or 1)
@@ -145,13 +390,77 @@ def scrape_directory(
     # Network
     proxy_url = str(opts.get("proxy_url") or "").strip()
 
-    log_lock = threading.Lock()
+    # Titles/plots recur across rereleases and series; translate each distinct text once per run.
+    tr_cache: dict[str, str] = {}
+    tr_cache_lock = threading.Lock()
+
+    def remember_translation(text: str, out: str | None) -> None:
+        # translate_text returns the input on failure; don't pin a failed attempt for the whole run.
+        if out and out != text:
+            with tr_cache_lock:
+                if len(tr_cache) >= _TRANSLATE_CACHE_MAX_ENTRIES:
+                    tr_cache.pop(next(iter(tr_cache)))
+                tr_cache[text] = out
+
+    def translate_many(texts: list[str]) -> list[str]:
+        return translate_text_batch(
+            texts,
+            target_lang=translate_target_lang,
+            provider=translate_provider,
+            base_url=translate_base_url,
+            api_key=translate_api_key,
+            email=translate_email,
+            proxy_url=proxy_url,
+        )
+
+    # Providers with a list API get one request per batch of texts instead of one per text:
+    # sequential runs translate a slice of files at once, threaded runs coalesce worker calls.
+    translate_batched = translate_enabled and supports_batch(translate_provider)
+    batcher = (
+        _TranslateBatcher(translate_many, max_items=_TRANSLATE_BATCH_SIZE, max_wait_sec=_TRANSLATE_BATCH_WAIT_SEC)
+        if translate_batched and threads > 1
+        else None
+    )
+
+    def cached_translate(text: str) -> str | None:
+        with tr_cache_lock:
+            hit = tr_cache.get(text)
+        if hit is not None:
+            return hit
+        if batcher is not None:
+            out = batcher.translate(text)
+        else:
+            out = translate_text(
+                text,
+                target_lang=translate_target_lang,
+                provider=translate_provider,
+                base_url=translate_base_url,
+                api_key=translate_api_key,
+                email=translate_email,
+                proxy_url=proxy_url,
+            )
+        remember_translation(text, out)
+        return out
+
+    # Workers only enqueue log lines; one writer thread calls log_cb in FIFO order,
+    # so workers never wait on each other (or on a slow log_cb) to log.
+    log_q: queue.SimpleQueue = queue.SimpleQueue()
+    log_stop = object()
+
+    def log_writer() -> None:
+        for msg in iter(log_q.get, log_stop):
+            try:
+                log_cb(msg)
+            except Exception:
+                pass
+
+    log_thread = threading.Thread(target=log_writer, name="scrape-log", daemon=True) if log_cb else None
+    # Diagnostic strings (plot previews, live.json payloads) are only built when someone reads them.
+    log_enabled = log_thread is not None
 
     def safe_log(msg: str) -> None:
-        if not log_cb:
-            return
-        with log_lock:
-            log_cb(msg)
+        if log_thread is not None:
+            log_q.put(msg)
 
     write_nfo_enabled = bool(opts.get("write_nfo", True))
     download_poster = bool(opts.get("download_poster", True))
@@ -159,6 +468,7 @@ def scrape_directory(
     download_previews = bool(opts.get("download_previews", False))
     download_trailer = bool(opts.get("download_trailer", False))
     download_subtitle = bool(opts.get("download_subtitle", False))
+    skip_existing_artwork = bool(opts.get("skip_existing_artwork", False))
     subtitle_languages = opts.get("subtitle_languages")
     preview_limit = int(opts.get("preview_limit", 8) or 8)
     nfo_fields_list = opts.get("nfo_fields")
@@ -176,6 +486,7 @@ def scrape_directory(
         download_previews=download_previews,
         download_trailer=download_trailer,
         preview_limit=preview_limit,
+        skip_existing_artwork=skip_existing_artwork,
         proxy_url=proxy_url or None,
         log_fn=safe_log,
     )
@@ -184,17 +495,9 @@ def scrape_directory(
     files = scan_videos(directory)
     safe_log(f"scan: found {len(files)} files")
     if min_age_sec and min_age_sec > 0:
-        now = time.time()
-        eligible = []
-        for p in files:
-            try:
-                st = p.stat()
-                if now - float(st.st_mtime) >= float(min_age_sec):
-                    eligible.append(p)
-            except Exception:
-                # If stat fails, skip to be safe
-                continue
-        files = eligible
+        cutoff = time.time() - min_age_sec
+        # If stat fails, skip to be safe.
+        files = [p for p in files if (mtime := _mtime_or_none(p)) is not None and mtime <= cutoff]
         safe_log(f"scan: eligible {len(files)} files (min_age_sec={min_age_sec})")
     total = len(files)
     results: list[ScrapeItemResult] = []
@@ -210,7 +513,50 @@ def scrape_directory(
             completed += 1
             progress_cb(completed, total, current_file)
 
-    def process_one(file_path: Path, index_hint: int) -> ScrapeItemResult:
+    # In-place skip checks list each source directory once instead of stat'ing every sibling NFO.
+    # NFOs written during the run are added so later files sharing a stem still see them.
+    dir_names: dict[Path, set[str]] = {}
+    dir_names_lock = threading.Lock()
+
+    def names_in(directory: Path) -> set[str]:
+        """``_name_key``s of the entries in ``directory`` (listed once per run)."""
+        with dir_names_lock:
+            names = dir_names.get(directory)
+            if names is None:
+                with os.scandir(directory) as it:
+                    names = dir_names[directory] = {_name_key(e.name) for e in it}
+            return names
+
+    def run_crawler(c, file_path: Path, media):
+        # Logged by the task itself so each "try" line precedes its own hit/miss line.
+        safe_log(f"try crawler: {getattr(c, 'name', 'unknown')}")
+        try:
+            r = c.crawl(file_path, media)
+            if r:
+                safe_log(
+                    f"hit crawler: {getattr(c, 'name', 'unknown')} title={r.title!r} url={r.original_url!r}"
+                )
+                try:
+                    pdata = r.data or {}
+                    pplot = pdata.get("plot") if log_enabled else None
+                    if isinstance(pplot, str) and pplot.strip():
+                        snippet = _RE_WS.sub(" ", pplot.strip())[:160]
+                        safe_log(f"  plot[{getattr(c, 'name', 'unknown')}]={snippet!r}")
+                except Exception:
+                    pass
+                return r
+            safe_log(f"miss crawler: {getattr(c, 'name', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"crawler {getattr(c, 'name', 'unknown')} failed for {file_path}: {e}")
+            safe_log(f"error crawler: {getattr(c, 'name', 'unknown')} error={e}")
+        return None
+
+    def gather_one(file_path: Path, index_hint: int, media: MediaInfo | None = None):
+        """Crawl, merge and sanitize one file (``media`` may be pre-probed by the caller).
+
+        Returns a finished ScrapeItemResult when the file is skipped, otherwise
+        ``(media, merged, per_file_results)`` for ``finish_one``.
+        """
         if progress_cb:
             # Do not advance progress on "start" (especially important for threads>1).
             # Only update current_file while keeping current monotonic (completed count).
@@ -225,10 +571,12 @@ def scrape_directory(
         # If writing in place and user chose to skip existing, short-circuit when NFO already exists.
         if output_dir is None and existing_action == "skip":
             try:
-                if file_path.with_suffix(".nfo").exists():
+                nfo_path = file_path.with_suffix(".nfo")
+                if _listed(nfo_path, names_in(file_path.parent)):
                     safe_log("skip: nfo already exists (in-place)")
                     bump_progress(str(file_path))
-                    media = read_media_info(file_path)
+                    if media is None:
+                        media = read_media_info(file_path)
                     merged = merge_results([])
                     merged.title = merged.title or file_path.stem
                     merged.external_id = merged.external_id or file_path.stem
@@ -243,31 +591,22 @@ def scrape_directory(
                 # If we can't check safely, fall through to normal processing.
                 pass
 
-        media = read_media_info(file_path)
-        per_file_results = []
+        if media is None:
+            media = read_media_info(file_path)
         safe_log("metadata: extracting from sources...")
-        for c in crawlers:
-            try:
-                safe_log(f"try crawler: {getattr(c, 'name', 'unknown')}")
-                r = c.crawl(file_path, media)
-                if r:
-                    safe_log(
-                        f"hit crawler: {getattr(c, 'name', 'unknown')} title={r.title!r} url={r.original_url!r}"
-                    )
-                    try:
-                        pdata = r.data or {}
-                        pplot = pdata.get("plot")
-                        if isinstance(pplot, str) and pplot.strip():
-                            snippet = re.sub(r"\s+", " ", pplot.strip())[:160]
-                            safe_log(f"  plot[{getattr(c, 'name', 'unknown')}]={snippet!r}")
-                    except Exception:
-                        pass
-                    per_file_results.append(r)
-                else:
-                    safe_log(f"miss crawler: {getattr(c, 'name', 'unknown')}")
-            except Exception as e:
-                logger.warning(f"crawler {getattr(c, 'name', 'unknown')} failed for {file_path}: {e}")
-                safe_log(f"error crawler: {getattr(c, 'name', 'unknown')} error={e}")
+        # Crawlers hit independent sites, so they run concurrently; results are kept in
+        # crawler order because merge priority ties and fallbacks depend on it.
+        slots: list = [None] * len(crawlers)
+        if crawl_pool is None:
+            for i, c in enumerate(crawlers):
+                slots[i] = run_crawler(c, file_path, media)
+        else:
+            futs = {}
+            for i, c in enumerate(crawlers):
+                futs[crawl_pool.submit(run_crawler, c, file_path, media)] = i
+            for fut in as_completed(futs):
+                slots[futs[fut]] = fut.result()
+        per_file_results = [r for r in slots if r]
 
         safe_log("metadata: merging results...")
         merged = merge_results(per_file_results, field_sources=field_sources)
@@ -276,108 +615,31 @@ def scrape_directory(
             merged.external_id = merged.external_id or file_path.stem
             merged.original_url = merged.original_url or None
 
-        _emit_live_json(safe_log, file_path=file_path, merged=merged, per_file_results=per_file_results)
-
-        # Debug: show merged plot before any sanitization.
-        try:
-            _p0 = (merged.data or {}).get("plot")
-            if isinstance(_p0, str) and _p0.strip():
-                safe_log(f"merged.plot(before)={_norm_ws(_p0)[:180]!r}")
-        except Exception:
-            pass
-
-        # Guardrail: drop known generic site slogans accidentally scraped as plot.
-        try:
-            data = merged.data or {}
-            plot = data.get("plot")
-            if isinstance(plot, str):
-                t = plot.strip()
-                if any(m in t for m in ("番号搜磁链", "管理你的成人影片", "分享你的想法")):
-                    data["plot"] = ""
-                    merged.data = data
-        except Exception:
-            pass
-
-        # Guardrail: drop JS/blocked placeholder plots (DMM often returns these when blocked).
-        try:
-            data = merged.data or {}
-            plot = data.get("plot")
-            if isinstance(plot, str) and plot.strip():
-                low = re.sub(r"\s+", " ", plot.strip()).lower()
-                bad = [
-                    "javascriptを有効",
-                    "javascriptの設定方法",
-                    "無料サンプル",
-                    "サンプル動画",
-                    "中古品",
-                    "画像をクリックして拡大",
-                    "拡大サンプル画像",
-                    "请启用javascript",
-                    "如何设置javascript",
-                    "单击图像放大",
-                ]
-                if any(m in low for m in bad):
-                    data.setdefault("plot_original", plot)
-                    data["plot"] = ""
-                    merged.data = data
-                    safe_log("drop plot: placeholder/js-blocked")
-        except Exception:
-            pass
+        if log_enabled:
+            _emit_live_json(safe_log, file_path=file_path, merged=merged, per_file_results=per_file_results)
 
-        # Guardrail: clean DMM/FANZA-style plot strings that include metadata prefix.
         try:
-            data = merged.data or {}
-            plot = data.get("plot")
-            if isinstance(plot, str) and plot.strip():
-                t = plot.strip()
-                # Trigger on common signals; be tolerant of fullwidth brackets.
-                looks_like_meta = (
-                    ("发布日期" in t and "时长" in t and "分钟" in t)
-                    or bool(re.search(r"(?:\[|［)\s*发布日期\s*(?:\]|］)", t))
-                    or bool(re.search(r"(?:\[|［)\s*时长\s*(?:\]|］)", t))
-                    or ("發行日期" in t and "長度" in t and "分鐘" in t)
-                    or bool(re.search(r"【\s*(?:發行日期|发行日期|发布日期)\s*】", t))
-                    or bool(re.search(r"【\s*(?:長度|长度|时长)\s*】", t))
-                )
-                if looks_like_meta:
-                    code_hint = str(merged.external_id or "").strip()
-                    # Strip leading metadata blocks.
-                    for _ in range(3):
-                        before = t
-                        t = re.sub(r"^\s*(?:\[|［)\s*发布日期\s*(?:\]|］)\s*[^，,]+\s*[，,]\s*", "", t)
-                        t = re.sub(r"^\s*(?:\[|［)\s*时长\s*(?:\]|］)\s*\d+\s*分钟\s*[，,]\s*", "", t)
-                        t = re.sub(r"^\s*【\s*(?:發行日期|发行日期|发布日期)\s*】\s*[^，,]+\s*[，,]\s*", "", t)
-                        t = re.sub(r"^\s*【\s*(?:長度|长度|时长)\s*】\s*\d+\s*(?:分钟|分鐘)\s*[，,]\s*", "", t)
-                        if t == before:
-                            break
-                    # Strip leading (CODE) (halfwidth/fullwidth parentheses)
-                    if code_hint:
-                        t = re.sub(rf"^[\(（]\s*{re.escape(code_hint)}\s*[\)）]\s*", "", t, flags=re.IGNORECASE)
-                    t = re.sub(r"^[\(（][A-Za-z0-9]+-[A-Za-z0-9]+[\)）]\s*", "", t)
-                    # Drop a quoted long title prefix if present.
-                    t = re.sub(r"^(?:“[^”]{5,300}”|「[^」]{5,300}」|『[^』]{5,300}』)\s*", "", t)
-                    t = t.lstrip(" :：-—，,")
-                    t = re.sub(r"\s+", " ", t).strip()
-                    if t and t != plot:
-                        data.setdefault("plot_original", plot)
-                        data["plot"] = t
-                        merged.data = data
-                        sanitized_t = re.sub(r'\s+', ' ', t)[:180]
-                        safe_log(f"merged.plot(sanitized)={sanitized_t!r}")
-        except Exception:
-            pass
-
-        # Debug: final plot that will be written to NFO (and then translated if enabled).
-        try:
-            _p1 = (merged.data or {}).get("plot")
-            if isinstance(_p1, str) and _p1.strip():
-                final_plot = re.sub(r'\s+', ' ', _p1.strip())[:180]
-                safe_log(f"merged.plot(final)={final_plot!r}")
-            else:
-                safe_log("merged.plot(final)=<empty>")
+            _apply_plot_guardrails(merged, safe_log if log_enabled else None)
         except Exception:
             pass
 
+        return media, merged, per_file_results
+
+    def translation_texts(merged) -> list[str]:
+        """Texts ``translate_merged`` will ask for: the title (unless it is just the code) and the plot."""
+        texts = []
+        title = merged.title
+        code = (merged.external_id or "").strip()
+        if isinstance(title, str):
+            t = title.strip()
+            if t and (not code or t.upper() != code.upper()):
+                texts.append(t)
+        plot = (merged.data or {}).get("plot")
+        if isinstance(plot, str) and plot.strip():
+            texts.append(plot)
+        return texts
+
+    def translate_merged(merged, translate) -> None:
         # Optional translation (best effort): translate title + plot into target language.
         if translate_enabled:
             try:
@@ -391,15 +653,7 @@ def scrape_directory(
                     # Skip translating when title is basically just the code.
                     if t and (not code or t.upper() != code.upper()):
                         safe_log("translate: title start")
-                        translated_title = translate_text(
-                            t,
-                            target_lang=translate_target_lang,
-                            provider=translate_provider,
-                            base_url=translate_base_url,
-                            api_key=translate_api_key,
-                            email=translate_email,
-                            proxy_url=proxy_url,
-                        )
+                        translated_title = translate(t)
                         if translated_title and translated_title.strip() and translated_title.strip() != t:
                             data.setdefault("title_original", t)
                             merged.title = translated_title.strip()
@@ -410,15 +664,7 @@ def scrape_directory(
                 plot = data.get("plot")
                 if isinstance(plot, str) and plot.strip():
                     safe_log("translate: plot start")
-                    translated_plot = translate_text(
-                        plot,
-                        target_lang=translate_target_lang,
-                        provider=translate_provider,
-                        base_url=translate_base_url,
-                        api_key=translate_api_key,
-                        email=translate_email,
-                        proxy_url=proxy_url,
-                    )
+                    translated_plot = translate(plot)
                     if translated_plot and translated_plot.strip() and translated_plot != plot:
                         data.setdefault("plot_original", plot)
                         data["plot"] = translated_plot
@@ -428,33 +674,54 @@ def scrape_directory(
             except Exception as e:
                 safe_log(f"translate failed: {e}")
 
+    # Per-file crawler fan-out. With several file workers each gets at most 4 concurrent
+    # crawlers, keeping in-flight requests to about threads * 4.
+    crawlers = list(crawlers or [])
+    outer_workers = max(1, min(int(threads), 32))
+    per_file = min(len(crawlers), 8 if outer_workers == 1 else 4)
+    crawl_pool = ThreadPoolExecutor(max_workers=per_file * outer_workers) if per_file > 1 else None
+
+    # One subtitle crawler (and HTTP session) per worker thread, reused across files.
+    sub_local = threading.local()
+    sub_crawlers: list[SubtitleCatCrawler] = []
+
+    def subtitle_crawler() -> SubtitleCatCrawler:
+        crawler = getattr(sub_local, "crawler", None)
+        if crawler is None:
+            crawler = sub_local.crawler = SubtitleCatCrawler(proxy_url=proxy_url, log_fn=safe_log)
+            sub_crawlers.append(crawler)
+        return crawler
+
+    def finish_one(file_path: Path, media, merged, per_file_results) -> ScrapeItemResult:
+        """Emit post-translation metadata, place the file, write the NFO and fetch extras."""
         # Emit post-translation live metadata for real-time UI (best effort).
-        try:
-            data = merged.data or {}
-            plot_val = data.get("plot")
-            plot_text = plot_val.strip() if isinstance(plot_val, str) else ""
-            plot_norm = re.sub(r"\s+", " ", plot_text).strip()
-            live = {
-                "phase": "post",
-                "file": str(file_path),
-                "file_name": str(file_path.name),
-                "code": str(merged.external_id or ""),
-                "title": str(merged.title or ""),
-                "url": str(merged.original_url or ""),
-                "release": data.get("release"),
-                "runtime": data.get("runtime"),
-                "studio": data.get("studio"),
-                "series": data.get("series"),
-                "actors": data.get("actors"),
-                "tags": data.get("tags"),
-                "poster_url": data.get("poster_url") or data.get("cover_url"),
-                "fanart_url": data.get("fanart_url"),
-                "plot_len": len(plot_text) if plot_text else 0,
-                "plot_preview": plot_norm[:240] if plot_norm else "",
-            }
-            safe_log("live.json: " + json.dumps(live, ensure_ascii=False, separators=(",", ":")))
-        except Exception:
-            pass
+        if log_enabled:
+            try:
+                data = merged.data or {}
+                plot_val = data.get("plot")
+                plot_text = plot_val.strip() if isinstance(plot_val, str) else ""
+                plot_norm = _RE_WS.sub(" ", plot_text).strip()
+                live = {
+                    "phase": "post",
+                    "file": str(file_path),
+                    "file_name": str(file_path.name),
+                    "code": str(merged.external_id or ""),
+                    "title": str(merged.title or ""),
+                    "url": str(merged.original_url or ""),
+                    "release": data.get("release"),
+                    "runtime": data.get("runtime"),
+                    "studio": data.get("studio"),
+                    "series": data.get("series"),
+                    "actors": data.get("actors"),
+                    "tags": data.get("tags"),
+                    "poster_url": data.get("poster_url") or data.get("cover_url"),
+                    "fanart_url": data.get("fanart_url"),
+                    "plot_len": len(plot_text) if plot_text else 0,
+                    "plot_preview": plot_norm[:240] if plot_norm else "",
+                }
+                safe_log("live.json: " + fastjson.dumps_compact(live))
+            except Exception:
+                pass
 
         # Determine final placement.
         final_path = file_path
@@ -467,7 +734,7 @@ def scrape_directory(
             code = merged.external_id or file_path.stem
             title = merged.title or file_path.stem
 
-            rel = structure.format(
+            rel = format_structure(
                 actor=_sanitize_segment(str(actor)),
                 year=_sanitize_segment(str(year)),
                 code=_sanitize_segment(str(code)),
@@ -481,7 +748,10 @@ def scrape_directory(
 
             # When output exists, user can choose to skip or overwrite.
             dest_nfo = dest_video.with_suffix(".nfo")
-            if existing_action == "skip" and (dest_video.exists() or dest_nfo.exists()):
+            # One directory listing answers every existence check below.
+            with os.scandir(dest_dir) as it:
+                dest_names = {_name_key(e.name) for e in it}
+            if existing_action == "skip" and (_listed(dest_video, dest_names) or _listed(dest_nfo, dest_names)):
                 safe_log("skip: output already exists")
                 bump_progress(str(file_path))
                 result = ScrapeItemResult(path=dest_video, media=media, merged=merged, sources=per_file_results)
@@ -491,7 +761,7 @@ def scrape_directory(
                     except Exception:
                         pass
                 return result
-            if existing_action == "overwrite" and dest_video.exists():
+            if existing_action == "overwrite" and _listed(dest_video, dest_names):
                 try:
                     dest_video.unlink()
                 except Exception:
@@ -520,6 +790,11 @@ def scrape_directory(
                     safe_log(f"move failed: {e}; keep in place")
 
         nfo_path = write_nfo(final_path, media, merged, options=nfo_opts)
+        if nfo_path is not None and output_dir is None:
+            with dir_names_lock:
+                names = dir_names.get(nfo_path.parent)
+                if names is not None:
+                    names.add(_name_key(nfo_path.name))
         if nfo_path is not None:
             logger.info(f"scraped: {final_path.name} -> {nfo_path.name}")
             safe_log(f"write nfo: {nfo_path.name}")
@@ -534,8 +809,7 @@ def scrape_directory(
                 code = (merged.external_id or file_path.stem).strip()
                 if code:
                     safe_log(f"subtitle: searching for {code}")
-                    sub_crawler = SubtitleCatCrawler(proxy_url=proxy_url, log_fn=safe_log)
-                    downloaded_subs = sub_crawler.search_and_download(
+                    downloaded_subs = subtitle_crawler().search_and_download(
                         keyword=code,
                         save_path_base=final_path.with_suffix(""),
                         languages=subtitle_languages
@@ -549,37 +823,42 @@ def scrape_directory(
                 safe_log(f"subtitle: failed {e}")
         
         # Emit live json again with subtitle info
-        _emit_live_json(safe_log, file_path=file_path, merged=merged, per_file_results=per_file_results, subtitles=downloaded_subs_paths)
+        if log_enabled:
+            _emit_live_json(safe_log, file_path=file_path, merged=merged, per_file_results=per_file_results, subtitles=downloaded_subs_paths)
 
         # Always check for local preview files so API/UI can prefer them over remote URLs.
         # This works whether previews were downloaded this run or existed from a previous run.
         if nfo_path is not None:
+            # One scandir pass finds both previews and the trailer; only entries whose
+            # name matches are checked with is_file().
+            stem = final_path.stem
+            preview_prefix = f"{stem}-preview-"
+            trailer_names = [f"{stem}-trailer{ext}" for ext in (".mp4", ".webm", ".mkv")]
+            preview_files = []
+            trailers = set()
             try:
-                preview_files = sorted(
-                    [p.name for p in final_path.parent.glob(f"{final_path.stem}-preview-*.*") if p.is_file()]
-                )
-                if preview_files:
-                    data = merged.data or {}
-                    data["preview_files"] = preview_files
-                    merged.data = data
+                with os.scandir(final_path.parent) as it:
+                    for e in it:
+                        n = e.name
+                        if not n.startswith(stem):
+                            continue
+                        if n.startswith(preview_prefix) and "." in n[len(preview_prefix):]:
+                            if e.is_file():
+                                preview_files.append(n)
+                        elif n in trailer_names and e.is_file():
+                            trailers.add(n)
             except Exception as e:
                 safe_log(f"warn: failed to enumerate downloaded preview files: {e}")
 
-            # Check for local trailer file
-            try:
-                trailer_patterns = [
-                    final_path.with_name(f"{final_path.stem}-trailer.mp4"),
-                    final_path.with_name(f"{final_path.stem}-trailer.webm"),
-                    final_path.with_name(f"{final_path.stem}-trailer.mkv"),
-                ]
-                for tp in trailer_patterns:
-                    if tp.exists() and tp.is_file():
-                        data = merged.data or {}
-                        data["trailer_file"] = tp.name
-                        merged.data = data
-                        break
-            except Exception as e:
-                safe_log(f"warn: failed to check for trailer file: {e}")
+            if preview_files or trailers:
+                data = merged.data or {}
+                if preview_files:
+                    data["preview_files"] = sorted(preview_files)
+                # Prefer mp4, then webm, then mkv.
+                trailer_name = next((n for n in trailer_names if n in trailers), None)
+                if trailer_name:
+                    data["trailer_file"] = trailer_name
+                merged.data = data
 
         result = ScrapeItemResult(
             path=final_path, 
@@ -599,26 +878,100 @@ def scrape_directory(
         bump_progress(str(file_path))
         return result
 
-    if threads <= 1:
-        for idx, file_path in enumerate(files, 1):
-            results.append(process_one(file_path, idx))
-        return results
+    def process_one(file_path: Path, index_hint: int, media: MediaInfo | None = None) -> ScrapeItemResult:
+        gathered = gather_one(file_path, index_hint, media)
+        if isinstance(gathered, ScrapeItemResult):
+            return gathered
+        media, merged, per_file_results = gathered
+        translate_merged(merged, cached_translate)
+        return finish_one(file_path, media, merged, per_file_results)
+
+    def run_all() -> None:
+        if threads <= 1 and translate_batched:
+            # Two phases per slice: crawl/merge every file, translate all titles and plots
+            # in one batch, then write NFOs and place files.
+            for start in range(0, total, _TRANSLATE_BATCH_SIZE):
+                batch = files[start : start + _TRANSLATE_BATCH_SIZE]
+                # Probe the slice's files concurrently up front instead of one by one.
+                medias = read_media_info_many(batch)
+                staged = []
+                for idx, (file_path, media) in enumerate(zip(batch, medias), start + 1):
+                    staged.append((file_path, gather_one(file_path, idx, media)))
+
+                wanted: dict[str, None] = {}
+                for _, gathered in staged:
+                    if not isinstance(gathered, ScrapeItemResult):
+                        wanted.update(dict.fromkeys(translation_texts(gathered[1])))
+                with tr_cache_lock:
+                    todo = [t for t in wanted if t not in tr_cache]
+                prefetched: dict[str, str | None] = {}
+                if todo:
+                    safe_log(f"translate: batch of {len(todo)} texts")
+                    try:
+                        prefetched = dict(zip(todo, translate_many(todo)))
+                    except Exception as e:
+                        safe_log(f"translate batch failed: {e}")
+                    for text, out in prefetched.items():
+                        remember_translation(text, out)
+
+                def translate(text: str) -> str | None:
+                    return prefetched[text] if text in prefetched else cached_translate(text)
+
+                for file_path, gathered in staged:
+                    if isinstance(gathered, ScrapeItemResult):
+                        results.append(gathered)
+                        continue
+                    media, merged, per_file_results = gathered
+                    translate_merged(merged, translate)
+                    results.append(finish_one(file_path, media, merged, per_file_results))
+            return
 
-    max_workers = max(1, min(int(threads), 32))
-    safe_log(f"parallel: threads={max_workers}")
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = {}
-        for idx, file_path in enumerate(files, 1):
-            futures[ex.submit(process_one, file_path, idx)] = file_path
+        if threads <= 1:
+            for start in range(0, total, _TRANSLATE_BATCH_SIZE):
+                batch = files[start : start + _TRANSLATE_BATCH_SIZE]
+                medias = read_media_info_many(batch)
+                for idx, (file_path, media) in enumerate(zip(batch, medias), start + 1):
+                    results.append(process_one(file_path, idx, media))
+            return
 
-        for fut in as_completed(futures):
-            try:
-                results.append(fut.result())
-            except Exception as e:
-                fp = futures.get(fut)
-                safe_log(f"file failed: {fp}: {e}")
+        safe_log(f"parallel: threads={outer_workers}")
+        # Results land in submission (scan) order, the same order a sequential run produces,
+        # so no sort is needed afterwards.
+        slots: list[ScrapeItemResult | None] = [None] * total
+        with ThreadPoolExecutor(max_workers=outer_workers) as ex:
+            futures = {}
+            for idx, file_path in enumerate(files, 1):
+                futures[ex.submit(process_one, file_path, idx)] = idx
+
+            for fut in as_completed(futures):
+                idx = futures[fut]
+                try:
+                    slots[idx - 1] = fut.result()
+                except Exception as e:
+                    safe_log(f"file failed: {files[idx - 1]}: {e}")
 
-    # Keep stable ordering for UI
-    results.sort(key=lambda r: str(r.path))
+        results.extend(r for r in slots if r is not None)
+
+    # Started right before the try so the finally below always stops it; lines logged
+    # during setup wait in log_q until then.
+    if log_thread is not None:
+        log_thread.start()
+    try:
+        run_all()
+    finally:
+        if crawl_pool is not None:
+            crawl_pool.shutdown(wait=True)
+        for c in sub_crawlers:
+            c.close()
+        # The caller owns (and closes) the metadata crawlers, but their conditional-GET
+        # caches are saved here so every entry point persists them.
+        for c in crawlers:
+            save = getattr(c, "save_etag_cache", None)
+            if save is not None:
+                save()
+        if log_thread is not None:
+            # Flush every queued line before returning to the caller.
+            log_q.put(log_stop)
+            log_thread.join()
 
     return results
@@ -8,67 +8,98 @@ from __future__ import annotations
 
 import re
 
+_RE_WS = re.compile(r"\s+")
+# Bracketed release-date / length labels ("[发布日期]", "【長度】", ...), fused so
+# one search covers all four variants.
+_RE_META_BRACKETS = re.compile(
+    r"[\[［]\s*(?:发布日期|时长)\s*[\]］]"
+    r"|【\s*(?:發行日期|发行日期|发布日期|長度|长度|时长)\s*】"
+)
+_RE_NON_ALNUM = re.compile(r"[^A-Za-z0-9]")
+_RE_DATE = re.compile(r"(20\d{2})[-/](\d{1,2})[-/](\d{1,2})")
+_RE_PS_JPG = re.compile(r"ps\.jpg(?=$|\?)", re.IGNORECASE)
+_RE_PL_JPG = re.compile(r"pl\.jpg(?=$|\?)", re.IGNORECASE)
+
 
 # ---------------------------------------------------------------------------
 # Plot / description quality checks
 # ---------------------------------------------------------------------------
 
+# Markers are matched against whitespace-collapsed, lower-cased text.
+_PLACEHOLDER_MARKERS = (
+    # Japanese DMM placeholders
+    "javascriptを有効",
+    "java scriptを有効",
+    "javascriptの設定方法",
+    "無料サンプル",
+    "サンプル動画",
+    "中古品",
+    "画像をクリックして拡大",
+    "拡大サンプル画像",
+    "安心な梱包",
+    # Chinese placeholders
+    "请启用javascript",
+    "如何设置javascript",
+    "单击图像放大",
+    "图像仅供说明",
+    "安全包装",
+)
+# Generic site slogans scraped instead of a plot.
+_SITE_SLOGAN_MARKERS = ("番号搜磁链", "管理你的成人影片", "分享你的想法")
+
+# One alternation per classifier (and one for both) so each check is a single
+# scan of the text instead of one substring search per marker.
+_RE_PLACEHOLDER_MARKERS = re.compile("|".join(map(re.escape, _PLACEHOLDER_MARKERS)))
+_RE_SITE_SLOGAN_MARKERS = re.compile("|".join(map(re.escape, _SITE_SLOGAN_MARKERS)))
+_RE_BAD_PLOT_MARKERS = re.compile("|".join(map(re.escape, _PLACEHOLDER_MARKERS + _SITE_SLOGAN_MARKERS)))
+
+
 def looks_placeholder_plot(s: str) -> bool:
     """Detect non-plot placeholders from blocked / JS-only pages."""
-    t = re.sub(r"\s+", " ", (s or "").strip()).lower()
-    if not t:
-        return True
-    bad_markers = [
-        # Japanese DMM placeholders
-        "javascriptを有効",
-        "java scriptを有効",
-        "javascriptの設定方法",
-        "無料サンプル",
-        "サンプル動画",
-        "中古品",
-        "画像をクリックして拡大",
-        "拡大サンプル画像",
-        "安心な梱包",
-        # Chinese placeholders
-        "请启用javascript",
-        "如何设置javascript",
-        "单击图像放大",
-        "图像仅供说明",
-        "安全包装",
-    ]
-    if any(m in t for m in bad_markers):
+    t = (s or "").strip()
+    # Empty or extremely short text is almost never a real plot; decide before
+    # paying for whitespace collapsing and the marker scan.
+    if len(t) < 20:
         return True
-    # Extremely short text is almost never a real plot.
-    return len(t) < 20
+    t = _RE_WS.sub(" ", t).lower()
+    return bool(_RE_PLACEHOLDER_MARKERS.search(t)) or len(t) < 20
 
 
-def looks_meta_plot(s: str) -> bool:
-    """Detect metadata-style text that is *not* a real plot synopsis."""
-    t = (s or "").strip()
-    if not t:
-        return False
-    if any(m in t for m in ("番号搜磁链", "管理你的成人影片", "分享你的想法")):
-        return True
+def _looks_meta_text(t: str) -> bool:
     # Chinese variants
     if "发布日期" in t and ("时长" in t or "長度" in t) and ("分钟" in t or "分鐘" in t):
         return True
     # Traditional Chinese variants
     if "發行日期" in t and "長度" in t and "分鐘" in t:
         return True
-    if re.search(r"(?:\[|［)\s*发布日期\s*(?:\]|］)", t):
-        return True
-    if re.search(r"(?:\[|［)\s*时长\s*(?:\]|］)", t):
-        return True
-    if re.search(r"【\s*(?:發行日期|发行日期|发布日期)\s*】", t):
-        return True
-    if re.search(r"【\s*(?:長度|长度|时长)\s*】", t):
+    return bool(_RE_META_BRACKETS.search(t))
+
+
+def looks_meta_plot(s: str) -> bool:
+    """Detect metadata-style text that is *not* a real plot synopsis."""
+    t = (s or "").strip()
+    if not t:
+        return False
+    if _RE_SITE_SLOGAN_MARKERS.search(t):
         return True
-    return False
+    return _looks_meta_text(t)
 
 
 def looks_bad_plot(s: str) -> bool:
-    """Return True if *s* looks like placeholder text or metadata, not a real plot."""
-    return looks_placeholder_plot(s) or looks_meta_plot(s)
+    """Return True if *s* looks like placeholder text or metadata, not a real plot.
+
+    Same result as ``looks_placeholder_plot(s) or looks_meta_plot(s)``, but the
+    text is normalized once and all markers are found in a single scan. None of
+    the meta checks depend on case or on runs of whitespace, so they can run on
+    the normalized text.
+    """
+    t = (s or "").strip()
+    if len(t) < 20:
+        return True
+    t = _RE_WS.sub(" ", t).lower()
+    if len(t) < 20 or _RE_BAD_PLOT_MARKERS.search(t):
+        return True
+    return _looks_meta_text(t)
 
 
 def looks_generic_site_desc(s: str) -> bool:
@@ -97,7 +128,7 @@ def looks_generic_site_desc(s: str) -> bool:
 
 def normalize_code(s: str) -> str:
     """Strip non-alphanumeric chars and uppercase, for code comparison."""
-    return re.sub(r"[^A-Za-z0-9]", "", (s or "").upper())
+    return _RE_NON_ALNUM.sub("", (s or "").upper())
 
 
 def normalize_release_date(s: str) -> str:
@@ -115,7 +146,7 @@ def normalize_release_date(s: str) -> str:
     # ISO 8601 with a 'T' separator – just take the date part.
     if "T" in t:
         t = t.split("T")[0]
-    m = re.search(r"(20\d{2})[-/](\d{1,2})[-/](\d{1,2})", t)
+    m = _RE_DATE.search(t)
     if m:
         y, mo, d = m.group(1), m.group(2).zfill(2), m.group(3).zfill(2)
         return f"{y}-{mo}-{d}"
@@ -141,12 +172,12 @@ def derive_dmm_artwork(cover_url: str | None) -> tuple[str | None, str | None]:
     low = u.lower()
     if "pics.dmm.co.jp/" not in low:
         return None, None
-    if re.search(r"(?i)ps\.jpg(?=$|\?)", u):
+    if _RE_PS_JPG.search(u):
         poster = u
-        fanart = re.sub(r"(?i)ps\.jpg(?=$|\?)", "pl.jpg", u, count=1)
+        fanart = _RE_PS_JPG.sub("pl.jpg", u, count=1)
         return poster, fanart
-    if re.search(r"(?i)pl\.jpg(?=$|\?)", u):
+    if _RE_PL_JPG.search(u):
         fanart = u
-        poster = re.sub(r"(?i)pl\.jpg(?=$|\?)", "ps.jpg", u, count=1)
+        poster = _RE_PL_JPG.sub("ps.jpg", u, count=1)
         return poster, fanart
     return None, None
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaInfo:
     path: Path
     size_bytes: int | None = None
@@ -14,7 +14,7 @@ class MediaInfo:
     height: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlResult:
     """Normalized metadata produced by crawlers.
 
@@ -28,7 +28,7 @@ class CrawlResult:
     data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeItemResult:
     path: Path
     media: MediaInfo
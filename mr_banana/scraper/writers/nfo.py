@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+import os
 import re
+import sqlite3
+import threading
 from urllib.parse import urlparse
 from xml.etree import ElementTree as ET
 from typing import Callable
@@ -16,11 +21,25 @@ try:
 except ImportError:
     HAS_PIL = False
 
+try:
+    from lxml import etree as lxml_etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 from ..types import MediaInfo, CrawlResult
 
+from mr_banana.utils.history import cache_path
 from mr_banana.utils.hls import HLSDownloader
 from mr_banana.utils.network import DEFAULT_USER_AGENT, NetworkHandler, build_proxies
 
+# Concurrent artwork fetches per title (fanart/poster chain, previews, trailer).
+_ARTWORK_MAX_WORKERS = 8
+# Segment workers for trailer HLS downloads; trailers are short and run next to the artwork pool.
+_TRAILER_HLS_WORKERS = 8
+# Existing files at or below this size are treated as broken/placeholder and re-downloaded.
+_EXISTING_MIN_BYTES = 4096
+
 
 @dataclass
 class NfoWriteOptions:
@@ -35,6 +54,10 @@ class NfoWriteOptions:
     download_trailer: bool = False
     preview_limit: int = 8
 
+    # Keep artwork/trailer files left by an earlier run without any request. Off by default:
+    # existing files are revalidated with a conditional GET (see _conditional_headers).
+    skip_existing_artwork: bool = False
+
     # Optional proxy for artwork downloads
     proxy_url: str | None = None
 
@@ -42,10 +65,25 @@ class NfoWriteOptions:
     log_fn: Callable[[str], None] | None = None
 
 
+# DMM content id in artwork paths, e.g. /digital/video/<cid>/<cid>pl.jpg
+_RE_DMM_CID = re.compile(r"/digital/video/([^/]+)/", re.IGNORECASE)
+_JAVTRAILERS_REFERER = "https://javtrailers.com/"
+# Shared request headers; callers only read them (downloads merge into a new dict).
+_JAVTRAILERS_HEADERS = {"User-Agent": DEFAULT_USER_AGENT, "Referer": _JAVTRAILERS_REFERER}
+
+
+_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+
+
+@lru_cache(maxsize=1024)
+def _url_suffix(url: str) -> str:
+    """Lower-cased file suffix of the URL path ("" when there is none)."""
+    return Path(urlparse(url).path).suffix.lower()
+
+
 def _guess_file_ext(url: str, fallback: str = ".mp4") -> str:
     try:
-        path = urlparse(url).path
-        ext = Path(path).suffix.lower()
+        ext = _url_suffix(url)
         if ext:
             return ext
     except Exception:
@@ -53,39 +91,93 @@ def _guess_file_ext(url: str, fallback: str = ".mp4") -> str:
     return fallback
 
 
+_STREAM_CHUNK = 64 * 1024
+
+
+def _has_existing(dest: Path) -> bool:
+    try:
+        return dest.stat().st_size > _EXISTING_MIN_BYTES
+    except OSError:
+        return False
+
+
+def _stream_to_file(r, dest: Path, max_bytes: int | None = None) -> int | None:
+    """Write a streamed response body to ``dest``; return bytes written.
+
+    The body goes to a ``.part`` file that replaces ``dest`` only when complete, so an
+    existing file survives a failed download. Returns None (and writes nothing) once
+    the body exceeds ``max_bytes``.
+    """
+    if max_bytes is not None:
+        try:
+            declared = int(r.headers.get("Content-Length") or 0)
+        except Exception:
+            declared = 0
+        if declared > max_bytes:
+            return None
+    tmp = dest.with_name(dest.name + ".part")
+    total = 0
+    try:
+        with open(tmp, "wb") as f:
+            for chunk in r.iter_content(chunk_size=_STREAM_CHUNK):
+                if not chunk:
+                    continue
+                total += len(chunk)
+                if max_bytes is not None and total > max_bytes:
+                    break
+                f.write(chunk)
+        if max_bytes is not None and total > max_bytes:
+            tmp.unlink()
+            return None
+        os.replace(tmp, dest)
+        return total
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
 def _download_file(
     url: str,
     dest: Path,
     max_bytes: int,
     *,
-    proxy_url: str | None = None,
+    proxies: dict[str, str] | None = None,
     headers: dict[str, str] | None = None,
     log_fn: Callable[[str], None] | None = None,
+    session: requests.Session | None = None,
+    skip_existing: bool = False,
 ) -> bool:
+    if skip_existing and _has_existing(dest):
+        if log_fn:
+            log_fn(f"trailer exists, skip: {dest.name}")
+        return True
     try:
-        proxies = build_proxies(proxy_url)
-        r = requests.get(
+        r = (session or requests).get(
             url,
             timeout=60,
             verify=False,
             impersonate="chrome",
             proxies=proxies,
             headers=headers or {},
+            stream=True,
         )
-        if r.status_code != 200:
-            if log_fn:
-                log_fn(f"trailer download failed: {r.status_code} {url}")
-            return False
-        content = getattr(r, "content", b"")
-        if content is None:
-            return False
-        if len(content) > max_bytes:
+        try:
+            if r.status_code != 200:
+                if log_fn:
+                    log_fn(f"trailer download failed: {r.status_code} {url}")
+                return False
+            size = _stream_to_file(r, dest, max_bytes)
+        finally:
+            r.close()
+        if size is None:
             if log_fn:
-                log_fn(f"trailer too large ({len(content)} bytes), skip: {url}")
+                log_fn(f"trailer too large (> {max_bytes} bytes), skip: {url}")
             return False
-        dest.write_bytes(content)
         if log_fn:
-            log_fn(f"trailer downloaded: {dest.name} ({len(content)} bytes) <- {url}")
+            log_fn(f"trailer downloaded: {dest.name} ({size} bytes) <- {url}")
         return True
     except Exception:
         if log_fn:
@@ -97,15 +189,13 @@ def _download_hls(
     m3u8_url: str,
     dest: Path,
     *,
-    proxy_url: str | None = None,
+    proxies: dict[str, str] | None = None,
     headers: dict[str, str] | None = None,
     log_fn: Callable[[str], None] | None = None,
 ) -> bool:
     try:
-        proxies = build_proxies(proxy_url)
-
         net = NetworkHandler(timeout=60, proxies=proxies)
-        dl = HLSDownloader(net)
+        dl = HLSDownloader(net, max_workers=_TRAILER_HLS_WORKERS)
         ok = dl.download(m3u8_url, str(dest), headers=headers)
         if log_fn:
             log_fn(f"trailer hls {'downloaded' if ok else 'failed'}: {dest.name} <- {m3u8_url}")
@@ -116,68 +206,206 @@ def _download_hls(
         return False
 
 
+# NFO trees are built and serialized with lxml (C serializer) when available.
+_XML = lxml_etree if HAS_LXML else ET
+# lxml refuses control characters that XML 1.0 can't represent; ElementTree would write them anyway.
+_RE_XML_INVALID = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
 def _text_el(parent: ET.Element, tag: str, text: str | None):
-    el = ET.SubElement(parent, tag)
+    el = _XML.SubElement(parent, tag)
     if text:
-        el.text = text
+        el.text = _RE_XML_INVALID.sub("", text) if HAS_LXML else text
     return el
 
 
 def _guess_image_ext(url: str) -> str:
     try:
-        path = urlparse(url).path
-        ext = Path(path).suffix.lower()
-        if ext in {".jpg", ".jpeg", ".png", ".webp"}:
+        ext = _url_suffix(url)
+        if ext in _IMAGE_EXTS:
             return ext
     except Exception:
         pass
     return ".jpg"
 
 
+# HTTP validators (ETag / Last-Modified) of downloaded artwork, keyed by destination
+# path, so a re-scrape can revalidate existing files with a conditional GET.
+_validator_lock = threading.Lock()
+_validator_conn: sqlite3.Connection | None = None
+_validator_failed = False
+
+
+def _validator_cache() -> sqlite3.Connection | None:
+    """Open the validator cache lazily. Caller must hold ``_validator_lock``."""
+    global _validator_conn, _validator_failed
+    if _validator_conn is not None or _validator_failed:
+        return _validator_conn
+    try:
+        path = cache_path("artwork.sqlite")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), check_same_thread=False)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS artwork (
+                path TEXT PRIMARY KEY,
+                url TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER
+            )
+            """
+        )
+        conn.commit()
+        _validator_conn = conn
+    except Exception:
+        _validator_failed = True
+    return _validator_conn
+
+
+def _conditional_headers(url: str, dest: Path) -> dict[str, str]:
+    """If-None-Match / If-Modified-Since for ``dest`` when it still holds what ``url`` served."""
+    try:
+        size = dest.stat().st_size
+    except OSError:
+        return {}
+    with _validator_lock:
+        conn = _validator_cache()
+        if conn is None:
+            return {}
+        try:
+            row = conn.execute(
+                "SELECT url, etag, last_modified, size FROM artwork WHERE path = ?", (str(dest),)
+            ).fetchone()
+        except Exception:
+            return {}
+    # A different source URL or a file changed on disk needs a full download.
+    if row is None or row[0] != url or row[3] != size:
+        return {}
+    out = {}
+    if row[1]:
+        out["If-None-Match"] = row[1]
+    if row[2]:
+        out["If-Modified-Since"] = row[2]
+    return out
+
+
+def _store_validators(url: str, dest: Path, r, size: int) -> None:
+    try:
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+    except Exception:
+        return
+    with _validator_lock:
+        conn = _validator_cache()
+        if conn is None:
+            return
+        try:
+            if etag or last_modified:
+                conn.execute(
+                    "INSERT OR REPLACE INTO artwork (path, url, etag, last_modified, size) VALUES (?, ?, ?, ?, ?)",
+                    (str(dest), url, etag, last_modified, size),
+                )
+            else:
+                conn.execute("DELETE FROM artwork WHERE path = ?", (str(dest),))
+            conn.commit()
+        except Exception:
+            pass
+
+
+def _is_placeholder_url(url: str) -> bool:
+    # DMM redirects missing assets to placeholder images (now_printing / noimage).
+    low = url.lower()
+    return "now_printing" in low or "/noimage/" in low
+
+
+def _probe_final_url(
+    url: str,
+    *,
+    proxies=None,
+    headers: dict[str, str] | None = None,
+    session: requests.Session | None = None,
+) -> str | None:
+    """Follow redirects with a HEAD request and return the final URL (None if the probe fails)."""
+    try:
+        r = (session or requests).head(
+            url,
+            timeout=10,
+            verify=False,
+            impersonate="chrome",
+            proxies=proxies,
+            headers=headers or {},
+            allow_redirects=True,
+        )
+        return str(getattr(r, "url", "") or "") or None
+    except Exception:
+        return None
+
+
 def _download_image(
     url: str,
     dest: Path,
     *,
-    proxy_url: str | None = None,
+    proxies: dict[str, str] | None = None,
     headers: dict[str, str] | None = None,
     log_fn: Callable[[str], None] | None = None,
+    session: requests.Session | None = None,
+    skip_existing: bool = False,
 ) -> bool:
+    """Download one image; placeholder redirects count as failures.
+
+    With ``skip_existing`` a non-trivial file already at ``dest`` is kept without a request.
+    """
+    if skip_existing and _has_existing(dest):
+        if log_fn:
+            log_fn(f"artwork exists, skip: {dest.name}")
+        return True
     try:
-        proxies = build_proxies(proxy_url)
-        r = requests.get(
+        # Revalidate a file left by an earlier scrape instead of fetching it again.
+        conditional = _conditional_headers(url, dest)
+        r = (session or requests).get(
             url,
             timeout=25,
             verify=False,
             impersonate="chrome",
             proxies=proxies,
-            headers=headers or {},
+            headers={**(headers or {}), **conditional},
+            stream=True,
         )
-        final_url = None
         try:
-            final_url = str(getattr(r, "url", "") or "")
-        except Exception:
+            if r.status_code == 304 and conditional:
+                if log_fn:
+                    log_fn(f"artwork not modified: {dest.name} <- {url}")
+                return True
             final_url = None
-
-        # DMM often redirects missing assets to placeholder images (now_printing / noimage).
-        # Treat those as a failed download to avoid saving blank previews.
-        if final_url:
-            low = final_url.lower()
-            if "now_printing" in low or "/noimage/" in low:
+            try:
+                final_url = str(getattr(r, "url", "") or "")
+            except Exception:
+                final_url = None
+
+            # DMM often redirects missing assets to placeholder images (now_printing / noimage).
+            # Treat those as a failed download to avoid saving blank previews.
+            # The redirect target is known from the headers, so the body is never read.
+            if final_url:
+                if _is_placeholder_url(final_url):
+                    if log_fn:
+                        log_fn(f"artwork placeholder image, skip: {final_url} <- {url}")
+                    try:
+                        if dest.exists():
+                            dest.unlink()
+                    except Exception:
+                        pass
+                    return False
+            if r.status_code != 200:
                 if log_fn:
-                    log_fn(f"artwork placeholder image, skip: {final_url} <- {url}")
-                try:
-                    if dest.exists():
-                        dest.unlink()
-                except Exception:
-                    pass
+                    log_fn(f"artwork download failed: {r.status_code} {url}")
                 return False
-        if r.status_code != 200:
-            if log_fn:
-                log_fn(f"artwork download failed: {r.status_code} {url}")
-            return False
-        dest.write_bytes(r.content)
+            size = _stream_to_file(r, dest)
+        finally:
+            r.close()
+        _store_validators(url, dest, r, size)
         if log_fn:
-            log_fn(f"artwork downloaded: {dest.name} ({len(r.content)} bytes) <- {url}")
+            log_fn(f"artwork downloaded: {dest.name} ({size} bytes) <- {url}")
         return True
     except Exception:
         if log_fn:
@@ -203,6 +431,8 @@ def _crop_poster_from_fanart(
     
     try:
         with Image.open(fanart_path) as img:
+            # JPEG: have libjpeg decode straight to RGB at full scale (no-op for other formats)
+            img.draft("RGB", img.size)
             width, height = img.size
             # 裁剪右边 47.5% (52.5% 位置开始)
             crop_start_x = int(width * 0.525)
@@ -211,7 +441,7 @@ def _crop_poster_from_fanart(
             # 保存为 JPEG，质量 95
             if cropped.mode in ('RGBA', 'P'):
                 cropped = cropped.convert('RGB')
-            cropped.save(poster_path, 'JPEG', quality=95)
+            cropped.save(poster_path, 'JPEG', quality=95, optimize=True, progressive=True)
             
             if log_fn:
                 log_fn(f"poster cropped from fanart: {poster_path.name} ({cropped.size[0]}x{cropped.size[1]})")
@@ -244,7 +474,7 @@ def write_nfo(video_path: Path, media: MediaInfo, meta: CrawlResult, options: Nf
         "artwork",
     }
 
-    root = ET.Element("movie")
+    root = _XML.Element("movie")
 
     if "title" in include:
         _text_el(root, "title", meta.title or video_path.stem)
@@ -300,7 +530,7 @@ def write_nfo(video_path: Path, media: MediaInfo, meta: CrawlResult, options: Nf
         for name in actors:
             if not name:
                 continue
-            actor_el = ET.SubElement(root, "actor")
+            actor_el = _XML.SubElement(root, "actor")
             _text_el(actor_el, "name", str(name))
             _text_el(actor_el, "type", "Actor")
 
@@ -317,15 +547,17 @@ def write_nfo(video_path: Path, media: MediaInfo, meta: CrawlResult, options: Nf
     if media.width and media.height and "resolution" in include:
         _text_el(root, "resolution", f"{media.width}x{media.height}")
 
-    poster_name = None
-    fanart_name = None
+    # The detail page is the referer for every download when known; resolve it once.
+    original_referer = None
+    try:
+        if isinstance(meta.original_url, str) and meta.original_url.strip():
+            original_referer = meta.original_url.strip()
+    except Exception:
+        pass
 
     def _referer_for(u: str) -> str | None:
-        try:
-            if isinstance(meta.original_url, str) and meta.original_url.strip():
-                return meta.original_url.strip()
-        except Exception:
-            pass
+        if original_referer:
+            return original_referer
         try:
             parsed = urlparse(str(u))
             if parsed.scheme and parsed.netloc:
@@ -334,137 +566,79 @@ def write_nfo(video_path: Path, media: MediaInfo, meta: CrawlResult, options: Nf
             return None
         return None
 
+    # With a known detail page every URL gets the same headers, so one dict is shared.
+    referer_headers = {"User-Agent": DEFAULT_USER_AGENT, "Referer": original_referer} if original_referer else None
+
     def _headers_for(u: str) -> dict[str, str]:
+        # JavTrailers (and some redirects like "fenza") may require a JavTrailers referer.
+        low = str(u).lower()
+        if "javtrailers.com" in low or "fenza" in low:
+            return _JAVTRAILERS_HEADERS
+        if referer_headers is not None:
+            return referer_headers
         h = {
             "User-Agent": DEFAULT_USER_AGENT,
         }
         ref = _referer_for(u)
         if ref:
             h["Referer"] = ref
-
-        # JavTrailers (and some redirects like "fenza") may require a JavTrailers referer.
-        low = str(u).lower()
-        if "javtrailers.com" in low or "fenza" in low:
-            h["Referer"] = "https://javtrailers.com/"
         return h
 
-    if fanart_url and opts.download_fanart:
-        ext = _guess_image_ext(str(fanart_url))
-        fanart_path = video_path.with_name(f"{video_path.stem}-fanart{ext}")
-        if emit:
-            emit(f"artwork try fanart: {fanart_url}")
-        if _download_image(str(fanart_url), fanart_path, proxy_url=opts.proxy_url, headers=_headers_for(str(fanart_url)), log_fn=emit):
-            fanart_name = fanart_path.name
+    skip_existing = bool(opts.skip_existing_artwork)
+    # Built once per title and shared by the session and every download helper.
+    proxies = build_proxies(opts.proxy_url)
+
+    def download_main_artwork() -> tuple[str | None, str | None]:
+        """Fanart, then poster (cropped from the fanart when possible). Returns (poster_name, fanart_name)."""
+        poster_name = None
+        fanart_name = None
+        if fanart_url and opts.download_fanart:
+            ext = _guess_image_ext(str(fanart_url))
+            fanart_path = video_path.with_name(f"{video_path.stem}-fanart{ext}")
+            if emit:
+                emit(f"artwork try fanart: {fanart_url}")
+            if _download_image(str(fanart_url), fanart_path, proxies=proxies, headers=_headers_for(str(fanart_url)), log_fn=emit, session=session, skip_existing=skip_existing):
+                fanart_name = fanart_path.name
             
-            # 优先从 fanart 裁剪 poster（更清晰）
-            if opts.download_poster:
-                poster_path = video_path.with_name(f"{video_path.stem}-poster.jpg")
-                if _crop_poster_from_fanart(fanart_path, poster_path, log_fn=emit):
-                    poster_name = poster_path.name
-                    # 已从 fanart 裁剪，跳过下载 poster_url
-                elif poster_url:
-                    # 裁剪失败，回退到下载 poster_url
-                    ext = _guess_image_ext(str(poster_url))
-                    poster_path = video_path.with_name(f"{video_path.stem}-poster{ext}")
-                    if emit:
-                        emit(f"artwork try poster (fallback): {poster_url}")
-                    if _download_image(str(poster_url), poster_path, proxy_url=opts.proxy_url, headers=_headers_for(str(poster_url)), log_fn=emit):
+                # 优先从 fanart 裁剪 poster（更清晰）
+                if opts.download_poster:
+                    poster_path = video_path.with_name(f"{video_path.stem}-poster.jpg")
+                    if skip_existing and _has_existing(poster_path):
                         poster_name = poster_path.name
-    elif poster_url and opts.download_poster:
-        # 没有 fanart，直接下载 poster
-        ext = _guess_image_ext(str(poster_url))
-        poster_path = video_path.with_name(f"{video_path.stem}-poster{ext}")
-        if emit:
-            emit(f"artwork try poster: {poster_url}")
-        if _download_image(str(poster_url), poster_path, proxy_url=opts.proxy_url, headers=_headers_for(str(poster_url)), log_fn=emit):
-            poster_name = poster_path.name
-
-    # Best-effort fallback: for some DMM titles, preview URLs follow a predictable pattern.
-    # If we didn't scrape any preview_urls but we do have a DMM poster URL, try generating candidates.
-    if opts.download_previews and not preview_urls:
-        try:
-            u = str(cover_url or poster_url or fanart_url or "").strip()
-            if u:
-                parsed = urlparse(u)
-                m = re.search(r"/digital/video/([^/]+)/", parsed.path, flags=re.IGNORECASE)
-                if m and parsed.scheme and parsed.netloc:
-                    cid = str(m.group(1))
-                    origin = f"{parsed.scheme}://{parsed.netloc}"
-                # Common DMM sample image pattern: <cid>jp-01.jpg ...
-                preview_urls = [f"{origin}/digital/video/{cid}/{cid}jp-{i:02d}.jpg" for i in range(1, 13)]
-                if emit:
-                    emit(f"artwork fallback previews: generated {len(preview_urls)} candidates from poster_url")
-
-                # If the first candidate resolves to DMM's placeholder image, the pattern is not valid for this title.
-                # Drop the whole list to avoid downloading multiple blank placeholders.
-                try:
-                    test_url = preview_urls[0] if preview_urls else ""
-                    if test_url:
-                        proxies = build_proxies(opts.proxy_url)
-                        rr = requests.get(
-                            test_url,
-                            timeout=15,
-                            verify=False,
-                            impersonate="chrome",
-                            proxies=proxies,
-                            headers=_headers_for(test_url),
-                        )
-                        final_url = ""
-                        try:
-                            final_url = str(getattr(rr, "url", "") or "")
-                        except Exception:
-                            final_url = ""
-                        low = final_url.lower() if final_url else ""
-                        if "now_printing" in low or "/noimage/" in low:
-                            preview_urls = []
-                            fallback_preview_placeholders = True
-                            if emit:
-                                emit(f"artwork fallback previews: placeholder detected, skip generating previews: {final_url}")
-                except Exception:
-                    # Keep the generated list; individual downloads will still validate placeholders.
-                    pass
-        except Exception:
-            # keep as empty
-            preview_urls = preview_urls or []
-
-    if opts.download_previews and preview_urls:
-        try:
-            limit = max(0, int(opts.preview_limit or 0))
-        except Exception:
-            limit = 0
-        if limit > 0:
-            for i, u in enumerate(preview_urls[:limit], 1):
-                try:
-                    ext = _guess_image_ext(str(u))
-                    p = video_path.with_name(f"{video_path.stem}-preview-{i:02d}{ext}")
-                    if emit:
-                        emit(f"artwork try preview[{i}]: {u}")
-                    _download_image(str(u), p, proxy_url=opts.proxy_url, headers=_headers_for(str(u)), log_fn=emit)
-                except Exception:
-                    pass
-    elif opts.download_previews and emit:
-        if fallback_preview_placeholders:
-            try:
-                # Remove previously saved placeholder previews (typically ~2-3KB) so users don't keep blank images.
-                for p in video_path.parent.glob(f"{video_path.stem}-preview-*"):
-                    try:
-                        if p.is_file() and p.stat().st_size <= 4096:
-                            p.unlink()
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-        emit("artwork skip previews: no preview_urls")
-
-    if opts.download_trailer and trailer_url:
+                    elif _crop_poster_from_fanart(fanart_path, poster_path, log_fn=emit):
+                        poster_name = poster_path.name
+                        # 已从 fanart 裁剪，跳过下载 poster_url
+                    elif poster_url:
+                        # 裁剪失败，回退到下载 poster_url
+                        ext = _guess_image_ext(str(poster_url))
+                        poster_path = video_path.with_name(f"{video_path.stem}-poster{ext}")
+                        if emit:
+                            emit(f"artwork try poster (fallback): {poster_url}")
+                        if _download_image(str(poster_url), poster_path, proxies=proxies, headers=_headers_for(str(poster_url)), log_fn=emit, session=session, skip_existing=skip_existing):
+                            poster_name = poster_path.name
+        elif poster_url and opts.download_poster:
+            # 没有 fanart，直接下载 poster
+            ext = _guess_image_ext(str(poster_url))
+            poster_path = video_path.with_name(f"{video_path.stem}-poster{ext}")
+            if emit:
+                emit(f"artwork try poster: {poster_url}")
+            if _download_image(str(poster_url), poster_path, proxies=proxies, headers=_headers_for(str(poster_url)), log_fn=emit, session=session, skip_existing=skip_existing):
+                poster_name = poster_path.name
+        return poster_name, fanart_name
+
+    def download_trailer() -> None:
         try:
             u = str(trailer_url)
             if ".m3u8" in u.lower():
                 trailer_path = video_path.with_name(f"{video_path.stem}-trailer.mp4")
+                if skip_existing and _has_existing(trailer_path):
+                    if emit:
+                        emit(f"trailer exists, skip: {trailer_path.name}")
+                    return
                 ok = _download_hls(
                     u,
                     trailer_path,
-                    proxy_url=opts.proxy_url,
+                    proxies=proxies,
                     headers=_headers_for(u),
                     log_fn=emit,
                 )
@@ -476,34 +650,152 @@ def write_nfo(video_path: Path, media: MediaInfo, meta: CrawlResult, options: Nf
                     u,
                     trailer_path,
                     max_bytes=200 * 1024 * 1024,
-                    proxy_url=opts.proxy_url,
+                    proxies=proxies,
                     headers=_headers_for(u),
                     log_fn=emit,
+                    session=session,
+                    skip_existing=skip_existing,
                 )
             if emit and not ok:
                 emit(f"warn: trailer not downloaded: {trailer_url}")
         except Exception:
             pass
-    elif opts.download_trailer and emit:
-        emit("trailer skip: no trailer_url")
+
+    # Downloads are independent network fetches, so they overlap: the fanart->poster chain,
+    # each preview and the trailer each run on their own worker. All of them share one
+    # session so connections to the artwork hosts are kept alive and reused.
+    poster_name = None
+    fanart_name = None
+    session = requests.Session(impersonate="chrome", proxies=proxies, verify=False)
+    try:
+        with ThreadPoolExecutor(max_workers=_ARTWORK_MAX_WORKERS) as ex:
+            pending = []
+            main_art = None
+            if (fanart_url and opts.download_fanart) or (poster_url and opts.download_poster):
+                main_art = ex.submit(download_main_artwork)
+            if opts.download_trailer and trailer_url:
+                pending.append(ex.submit(download_trailer))
+            elif opts.download_trailer and emit:
+                emit("trailer skip: no trailer_url")
+
+            # Best-effort fallback: for some DMM titles, preview URLs follow a predictable pattern.
+            # If we didn't scrape any preview_urls but we do have a DMM poster URL, try generating candidates.
+            if opts.download_previews and not preview_urls:
+                try:
+                    u = str(cover_url or poster_url or fanart_url or "").strip()
+                    if u:
+                        parsed = urlparse(u)
+                        m = _RE_DMM_CID.search(parsed.path)
+                        if m and parsed.scheme and parsed.netloc:
+                            cid = str(m.group(1))
+                            origin = f"{parsed.scheme}://{parsed.netloc}"
+                        # Common DMM sample image pattern: <cid>jp-01.jpg ...
+                        preview_urls = [f"{origin}/digital/video/{cid}/{cid}jp-{i:02d}.jpg" for i in range(1, 13)]
+                        if emit:
+                            emit(f"artwork fallback previews: generated {len(preview_urls)} candidates from poster_url")
+
+                        # Guessed candidates often redirect to DMM's placeholder image. HEAD them all in
+                        # parallel (only the redirect target matters) and keep the real ones, so no
+                        # placeholder body is downloaded and the preview numbering has no gaps.
+                        try:
+                            candidates = preview_urls
+                            finals = list(
+                                ex.map(
+                                    lambda c: _probe_final_url(c, headers=_headers_for(c), session=session) or "",
+                                    candidates,
+                                )
+                            )
+                            preview_urls = [c for c, f in zip(candidates, finals) if not _is_placeholder_url(f)]
+                            if not preview_urls:
+                                fallback_preview_placeholders = True
+                                if emit:
+                                    emit("artwork fallback previews: placeholder detected, skip generating previews")
+                            elif len(preview_urls) < len(candidates) and emit:
+                                emit(f"artwork fallback previews: dropped {len(candidates) - len(preview_urls)} placeholder candidates")
+                        except Exception:
+                            # Keep the generated list; individual downloads will still validate placeholders.
+                            pass
+                except Exception:
+                    # keep as empty
+                    preview_urls = preview_urls or []
+
+            if opts.download_previews and preview_urls:
+                try:
+                    limit = max(0, int(opts.preview_limit or 0))
+                except Exception:
+                    limit = 0
+                if limit > 0:
+                    for i, u in enumerate(preview_urls[:limit], 1):
+                        try:
+                            ext = _guess_image_ext(str(u))
+                            p = video_path.with_name(f"{video_path.stem}-preview-{i:02d}{ext}")
+                            if emit:
+                                emit(f"artwork try preview[{i}]: {u}")
+                            pending.append(
+                                ex.submit(
+                                    _download_image,
+                                    str(u),
+                                    p,
+                                    proxies=proxies,
+                                    headers=_headers_for(str(u)),
+                                    log_fn=emit,
+                                    session=session,
+                                    skip_existing=skip_existing,
+                                )
+                            )
+                        except Exception:
+                            pass
+            elif opts.download_previews and emit:
+                if fallback_preview_placeholders:
+                    try:
+                        # Remove previously saved placeholder previews (typically ~2-3KB) so users don't keep blank images.
+                        # One scandir pass with a prefix test; glob metacharacters in the stem stay literal.
+                        prefix = f"{video_path.stem}-preview-"
+                        with os.scandir(video_path.parent) as it:
+                            for e in it:
+                                if not e.name.startswith(prefix):
+                                    continue
+                                try:
+                                    if e.is_file() and e.stat().st_size <= 4096:
+                                        os.unlink(e.path)
+                                except Exception:
+                                    pass
+                    except Exception:
+                        pass
+                emit("artwork skip previews: no preview_urls")
+
+            for fut in pending:
+                try:
+                    fut.result()
+                except Exception:
+                    pass
+            if main_art is not None:
+                try:
+                    poster_name, fanart_name = main_art.result()
+                except Exception:
+                    pass
+    finally:
+        session.close()
 
     if "artwork" in include:
         if poster_name:
             _text_el(root, "poster", poster_name)
             _text_el(root, "cover", poster_name)
         if fanart_name:
-            fanart_el = ET.SubElement(root, "fanart")
+            fanart_el = _XML.SubElement(root, "fanart")
             _text_el(fanart_el, "thumb", fanart_name)
 
     if not opts.write_nfo:
         return None
 
     nfo_path = video_path.with_suffix(".nfo")
-    try:
-        ET.indent(root)  # py>=3.9
-    except Exception:
-        pass
-
-    xml = ET.tostring(root, encoding="utf-8", xml_declaration=True)
+    if HAS_LXML:
+        xml = lxml_etree.tostring(root, encoding="utf-8", xml_declaration=True, pretty_print=True)
+    else:
+        try:
+            ET.indent(root)  # py>=3.9
+        except Exception:
+            pass
+        xml = ET.tostring(root, encoding="utf-8", xml_declaration=True)
     nfo_path.write_bytes(xml)
     return nfo_path
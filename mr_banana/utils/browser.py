@@ -1,17 +1,50 @@
 """
 浏览器自动化模块 - 用于绕过 Cloudflare 等防护
 """
+import atexit
+import queue
 import time
 import subprocess
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from typing import Optional
+from urllib.parse import urlsplit
 from patchright.sync_api import sync_playwright, Page, Browser, BrowserContext
-from mr_banana.utils.logger import logger
+from mr_banana.utils.logger import logger, get_task_id, set_task_id, clear_task_id
+
+
+# Only the HTML DOM is read, so these resource types are never fetched. Stylesheets are
+# kept: the Cloudflare challenge widget needs them to render its checkbox.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+# Challenge hosts are never blocked, whatever the resource type.
+_CHALLENGE_HOST_SUFFIXES = ("challenges.cloudflare.com",)
+# Upper bound a caller waits for one page scrape (queueing included); a Cloudflare
+# challenge plus the content waits below stays well under this.
+_SCRAPE_TIMEOUT_SEC = 180.0
+
+
+def _block_heavy_resources(route) -> None:
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        host = (urlsplit(request.url).hostname or "").lower()
+        if not host.endswith(_CHALLENGE_HOST_SUFFIXES):
+            route.abort()
+            return
+    route.continue_()
 
 
 class BrowserManager:
     """浏览器管理器，用于获取需要 JavaScript 渲染的页面内容"""
 
     _chromium_checked: bool = False  # Class-level: only run install once per process
+    # The sync Playwright API is bound to the thread that started it, so one dedicated
+    # browser thread owns the driver and the warm browsers (keyed by launch options);
+    # every other thread submits its scrapes to it through a queue.
+    _jobs: "queue.SimpleQueue | None" = None
+    _browser_thread: threading.Thread | None = None
+    _thread_lock = threading.Lock()
+    # Driver and browsers of each browser thread (a hung thread is replaced, not reused).
+    _local = threading.local()
 
     def __init__(self, headless: bool = True, proxy_url: str | None = None):
         self.headless = headless
@@ -39,21 +72,134 @@ class BrowserManager:
 
     def scrape_page(self, url: str) -> Optional[str]:
         """使用浏览器获取页面内容"""
-        logger.info(f"Launching browser to visit: {url}")
+        logger.info(f"Opening browser page to visit: {url}")
+        fut: Future = Future()
+        jobs = self._submit((fut, self._scrape_on_browser_thread, (url, get_task_id())))
+        try:
+            return fut.result(timeout=_SCRAPE_TIMEOUT_SEC)
+        except FutureTimeoutError:
+            if fut.cancel():
+                logger.error(f"Timed out waiting for the browser: {url}")
+                return None
+            if fut.done():
+                return fut.result()
+            # The running scrape is stuck; later scrapes go to a fresh browser thread.
+            logger.error(f"Browser scrape timed out, restarting the browser: {url}")
+            self._abandon(jobs)
+            return None
 
-        with sync_playwright() as p:
-            browser = self._launch_browser(p)
+    def _scrape_on_browser_thread(self, url: str, task_id: str | None) -> Optional[str]:
+        # Keep the caller's task id so these logs still land in its task log.
+        set_task_id(task_id)
+        try:
+            browser = self._get_browser()
             context = self._create_context(browser)
+        except BaseException:
+            # Launch failures propagate to the caller through the future, as before.
+            clear_task_id()
+            raise
+        try:
             page = context.new_page()
+            content = self._process_page(page, url)
+            return content
+        except Exception as e:
+            logger.error(f"Error scraping page: {e}")
+            return None
+        finally:
+            # Only the context is per-call; the browser stays warm for the next scrape.
+            try:
+                context.close()
+            except Exception:
+                pass
+            clear_task_id()
+
+    def _get_browser(self) -> Browser:
+        """返回浏览器线程复用的浏览器实例（首次使用或断开后重新启动）"""
+        local = BrowserManager._local
+        browsers = local.__dict__.setdefault("browsers", {})
+        key = (self.headless, self.proxy_url)
+        browser = browsers.get(key)
+        if browser is not None and browser.is_connected():
+            return browser
+        if getattr(local, "playwright", None) is None:
+            local.playwright = sync_playwright().start()
+        logger.info("Launching browser")
+        browser = self._launch_browser(local.playwright)
+        browsers[key] = browser
+        return browser
+
+    @classmethod
+    def _submit(cls, job) -> "queue.SimpleQueue":
+        """把任务交给浏览器线程执行（按需启动该线程），返回所用的任务队列"""
+        with cls._thread_lock:
+            if cls._browser_thread is None or not cls._browser_thread.is_alive():
+                cls._jobs = queue.SimpleQueue()
+                cls._browser_thread = threading.Thread(
+                    target=cls._browser_loop, args=(cls._jobs,), name="browser", daemon=True
+                )
+                cls._browser_thread.start()
+            cls._jobs.put(job)
+            return cls._jobs
 
+    @classmethod
+    def _abandon(cls, jobs: "queue.SimpleQueue") -> None:
+        """放弃卡住的浏览器线程：排队中的任务转给新线程，旧线程恢复后自行关闭"""
+        with cls._thread_lock:
+            if cls._jobs is not jobs:
+                return  # Another caller already replaced it.
+            cls._browser_thread = cls._jobs = None
+        pending = []
+        while True:
+            try:
+                job = jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                pending.append(job)
+        jobs.put(None)
+        for job in pending:
+            cls._submit(job)
+
+    @classmethod
+    def _browser_loop(cls, jobs: "queue.SimpleQueue") -> None:
+        """浏览器线程：依次执行提交的任务，收到 None 后关闭浏览器并退出"""
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+            fut, fn, args = job
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(fn(*args))
+            except BaseException as e:
+                fut.set_exception(e)
+        cls._close_browsers()
+
+    @classmethod
+    def _close_browsers(cls) -> None:
+        local = cls._local
+        for browser in local.__dict__.pop("browsers", {}).values():
             try:
-                content = self._process_page(page, url)
-                return content
-            except Exception as e:
-                logger.error(f"Error scraping page: {e}")
-                return None
-            finally:
                 browser.close()
+            except Exception:
+                pass
+        playwright = local.__dict__.pop("playwright", None)
+        if playwright is not None:
+            try:
+                playwright.stop()
+            except Exception:
+                pass
+
+    @classmethod
+    def _shutdown(cls) -> None:
+        """进程退出时在浏览器线程上关闭浏览器（尽力而为）"""
+        with cls._thread_lock:
+            thread, jobs = cls._browser_thread, cls._jobs
+            cls._browser_thread = cls._jobs = None
+        if thread is not None and thread.is_alive():
+            jobs.put(None)
+            thread.join(timeout=10)
 
     def _launch_browser(self, p) -> Browser:
         """启动浏览器实例"""
@@ -74,7 +220,6 @@ class BrowserManager:
         launch_kwargs = {
             "headless": self.headless,
             "args": browser_args,
-            "slow_mo": 50,
         }
         if self.proxy_url:
             launch_kwargs["proxy"] = {"server": self.proxy_url}
@@ -85,7 +230,7 @@ class BrowserManager:
 
     def _create_context(self, browser: Browser) -> BrowserContext:
         """创建浏览器上下文"""
-        return browser.new_context(
+        context = browser.new_context(
             viewport={"width": 1920, "height": 1080},
             locale="en-US",
             timezone_id="America/New_York",
@@ -93,6 +238,8 @@ class BrowserManager:
             # Use same Chrome version as WINDOWS_USER_AGENT in network.py
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
         )
+        context.route("**/*", _block_heavy_resources)
+        return context
 
     def _process_page(self, page: Page, url: str) -> str:
         """处理页面并返回内容"""
@@ -120,7 +267,13 @@ class BrowserManager:
             except Exception:
                 logger.warning("Timed out waiting for title change; trying to click challenge...")
                 self._click_challenge(page)
-                time.sleep(10)
+                try:
+                    page.wait_for_function(
+                        "!document.querySelector('#challenge-stage') && document.title != 'Just a moment...'",
+                        timeout=10000,
+                    )
+                except Exception:
+                    logger.warning("Cloudflare challenge still present after click")
 
     def _click_challenge(self, page: Page):
         """点击 Cloudflare 验证按钮"""
@@ -160,6 +313,12 @@ class BrowserManager:
     def _scroll_page(self, page: Page):
         """模拟页面滚动"""
         logger.info("Scrolling page...")
-        for _ in range(3):
-            page.evaluate("window.scrollBy(0, window.innerHeight / 2)")
-            time.sleep(1)
+        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        # Let lazy-loaded content settle instead of sleeping a fixed time.
+        try:
+            page.wait_for_load_state("networkidle", timeout=3000)
+        except Exception:
+            pass
+
+
+atexit.register(BrowserManager._shutdown)
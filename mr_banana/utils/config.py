@@ -1,27 +1,73 @@
 from __future__ import annotations
 
-import json
 import os
 import tempfile
 import threading
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
+from mr_banana.utils import fastjson
 
 # Implemented crawl sources in this project
-_IMPLEMENTED_SOURCES = {"javdb", "jav321", "javbus", "dmm", "javtrailers", "theporndb"}
+_IMPLEMENTED_SOURCES = frozenset({"javdb", "jav321", "javbus", "dmm", "javtrailers", "theporndb"})
 
 # Canonical execution order
 _SOURCE_ORDER = ["javbus", "jav321", "dmm", "javdb", "javtrailers", "theporndb"]
 
+# User requested deterministic upstream ordering + fallback semantics.
+_FALLBACK_DEFAULT = ("javbus", "jav321", "dmm", "javdb")
+
+# Per-field allowed sources (also used to limit UI options).
+_ALLOWED_SOURCES: dict[str, frozenset[str]] = {
+    "scrape_sources_fallback": frozenset({"javbus", "jav321", "dmm", "javdb"}),
+    "scrape_sources_title": frozenset({"dmm", "javtrailers"}),
+    "scrape_sources_plot": frozenset({"dmm"}),
+    "scrape_sources_actors": frozenset({"dmm", "javtrailers"}),
+    "scrape_sources_tags": frozenset({"dmm", "javtrailers"}),
+    "scrape_sources_release": frozenset({"dmm", "javtrailers"}),
+    "scrape_sources_runtime": frozenset({"dmm", "javtrailers"}),
+    "scrape_sources_directors": frozenset({"dmm"}),
+    "scrape_sources_series": frozenset({"dmm"}),
+    "scrape_sources_studio": frozenset({"dmm", "javtrailers"}),
+    "scrape_sources_publisher": frozenset({"dmm", "javtrailers"}),
+    "scrape_sources_trailer": frozenset({"javtrailers", "dmm"}),
+    "scrape_sources_rating": frozenset({"jav321", "javdb"}),
+    "scrape_sources_want": frozenset({"javdb"}),
+    "scrape_sources_poster": frozenset({"javtrailers", "javbus"}),
+    "scrape_sources_fanart": frozenset({"javtrailers", "javbus"}),
+    "scrape_sources_previews": frozenset({"javtrailers", "javbus"}),
+}
+
+# Per-field source lists: (attribute, default). Defaults match the user-provided specification;
+# allowed sources come from _ALLOWED_SOURCES. An empty list disables the field.
+_FIELD_SOURCE_DEFAULTS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("scrape_sources_title", ("dmm", "javtrailers")),
+    ("scrape_sources_plot", ("dmm",)),
+    ("scrape_sources_actors", ("dmm", "javtrailers")),
+    ("scrape_sources_poster", ("javtrailers", "javbus")),
+    ("scrape_sources_fanart", ("javtrailers", "javbus")),
+    ("scrape_sources_previews", ("javtrailers", "javbus")),
+    ("scrape_sources_trailer", ("javtrailers", "dmm")),
+    ("scrape_sources_tags", ("dmm", "javtrailers")),
+    ("scrape_sources_release", ("dmm", "javtrailers")),
+    ("scrape_sources_runtime", ("dmm", "javtrailers")),
+    ("scrape_sources_directors", ("dmm",)),
+    ("scrape_sources_series", ("dmm",)),
+    ("scrape_sources_studio", ("dmm", "javtrailers")),
+    ("scrape_sources_publisher", ("dmm", "javtrailers")),
+    ("scrape_sources_rating", ("jav321", "javdb")),
+    ("scrape_sources_want", ("javdb",)),
+)
+
 
 def _normalize_source_list(
     value: object,
     *,
-    default: list[str],
+    default: list[str] | tuple[str, ...],
     allow_empty: bool,
-    allowed_sources: set[str] | None = None,
+    allowed_sources: frozenset[str] | set[str] | None = None,
 ) -> list[str]:
     """Normalize a list of crawl source names: dedupe, validate, enforce allowed set."""
     allowed_set = allowed_sources if allowed_sources is not None else _IMPLEMENTED_SOURCES
@@ -31,6 +77,14 @@ def _normalize_source_list(
         return []
     elif not value:
         value = list(default)
+    # Fast path: lists loaded back from config.json are already clean (known, unique,
+    # lower-case names), which is exactly what the loop below would return.
+    try:
+        uniq = set(value)
+    except TypeError:
+        uniq = None
+    if uniq is not None and len(uniq) == len(value) and uniq <= allowed_set and uniq <= _IMPLEMENTED_SOURCES:
+        return list(value)
     out: list[str] = []
     seen: set[str] = set()
     for x in value:
@@ -58,7 +112,7 @@ else:
     CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     output_dir: str = ""
     max_concurrent_downloads: int = 5
@@ -147,6 +201,8 @@ class AppConfig:
     scrape_download_previews: bool = True
     scrape_download_trailer: bool = True
     scrape_download_subtitle: bool = True
+    # Keep poster/fanart/preview files already on disk without revalidating them.
+    scrape_skip_existing_artwork: bool = False
     scrape_subtitle_languages: list[str] = field(default_factory=list)
     scrape_preview_limit: int = 8
 
@@ -183,8 +239,8 @@ class AppConfig:
     javbus_cookie: str = ""
 
     def __post_init__(self) -> None:
-        # User requested deterministic upstream ordering + fallback semantics.
-        fallback_default = ["javbus", "jav321", "dmm", "javdb"]
+        fallback_default = _FALLBACK_DEFAULT
+        allowed = _ALLOWED_SOURCES
 
         if not self.scrape_sources:
             # Overall enabled sources for crawler execution (union is computed below).
@@ -196,27 +252,6 @@ class AppConfig:
         if not self.scrape_subtitle_languages:
             self.scrape_subtitle_languages = ["zh", "ja"]
 
-        # Per-field allowed sources (also used to limit UI options).
-        allowed: dict[str, set[str]] = {
-            "scrape_sources_fallback": {"javbus", "jav321", "dmm", "javdb"},
-            "scrape_sources_title": {"dmm", "javtrailers"},
-            "scrape_sources_plot": {"dmm"},
-            "scrape_sources_actors": {"dmm", "javtrailers"},
-            "scrape_sources_tags": {"dmm", "javtrailers"},
-            "scrape_sources_release": {"dmm", "javtrailers"},
-            "scrape_sources_runtime": {"dmm", "javtrailers"},
-            "scrape_sources_directors": {"dmm"},
-            "scrape_sources_series": {"dmm"},
-            "scrape_sources_studio": {"dmm", "javtrailers"},
-            "scrape_sources_publisher": {"dmm", "javtrailers"},
-            "scrape_sources_trailer": {"javtrailers", "dmm"},
-            "scrape_sources_rating": {"jav321", "javdb"},
-            "scrape_sources_want": {"javdb"},
-            "scrape_sources_poster": {"javtrailers", "javbus"},
-            "scrape_sources_fanart": {"javtrailers", "javbus"},
-            "scrape_sources_previews": {"javtrailers", "javbus"},
-        }
-
         enabled_union = _normalize_source_list(self.scrape_sources, default=fallback_default, allow_empty=False)
         self.scrape_sources_fallback = _normalize_source_list(
             self.scrape_sources_fallback,
@@ -225,105 +260,18 @@ class AppConfig:
             allowed_sources=allowed.get("scrape_sources_fallback"),
         )
 
-        # Per-field defaults match the user-provided specification.
-        self.scrape_sources_title = _normalize_source_list(
-            self.scrape_sources_title,
-            default=["dmm", "javtrailers"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_title"),
-        )
-        self.scrape_sources_plot = _normalize_source_list(
-            self.scrape_sources_plot,
-            default=["dmm"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_plot"),
-        )
-        self.scrape_sources_actors = _normalize_source_list(
-            self.scrape_sources_actors,
-            default=["dmm", "javtrailers"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_actors"),
-        )
-        self.scrape_sources_poster = _normalize_source_list(
-            self.scrape_sources_poster,
-            default=["javtrailers", "javbus"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_poster"),
-        )
-        self.scrape_sources_fanart = _normalize_source_list(
-            self.scrape_sources_fanart,
-            default=["javtrailers", "javbus"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_fanart"),
-        )
-        self.scrape_sources_previews = _normalize_source_list(
-            self.scrape_sources_previews,
-            default=["javtrailers", "javbus"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_previews"),
-        )
-        self.scrape_sources_trailer = _normalize_source_list(
-            self.scrape_sources_trailer,
-            default=["javtrailers", "dmm"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_trailer"),
-        )
-
-        self.scrape_sources_tags = _normalize_source_list(
-            self.scrape_sources_tags,
-            default=["dmm", "javtrailers"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_tags"),
-        )
-        self.scrape_sources_release = _normalize_source_list(
-            self.scrape_sources_release,
-            default=["dmm", "javtrailers"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_release"),
-        )
-        self.scrape_sources_runtime = _normalize_source_list(
-            self.scrape_sources_runtime,
-            default=["dmm", "javtrailers"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_runtime"),
-        )
-        self.scrape_sources_directors = _normalize_source_list(
-            self.scrape_sources_directors,
-            default=["dmm"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_directors"),
-        )
-        self.scrape_sources_series = _normalize_source_list(
-            self.scrape_sources_series,
-            default=["dmm"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_series"),
-        )
-        self.scrape_sources_studio = _normalize_source_list(
-            self.scrape_sources_studio,
-            default=["dmm", "javtrailers"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_studio"),
-        )
-        self.scrape_sources_publisher = _normalize_source_list(
-            self.scrape_sources_publisher,
-            default=["dmm", "javtrailers"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_publisher"),
-        )
-
-        self.scrape_sources_rating = _normalize_source_list(
-            self.scrape_sources_rating,
-            default=["jav321", "javdb"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_rating"),
-        )
-        self.scrape_sources_want = _normalize_source_list(
-            self.scrape_sources_want,
-            default=["javdb"],
-            allow_empty=True,
-            allowed_sources=allowed.get("scrape_sources_want"),
-        )
+        # Per-field source lists (see _FIELD_SOURCE_DEFAULTS).
+        for name, default in _FIELD_SOURCE_DEFAULTS:
+            setattr(
+                self,
+                name,
+                _normalize_source_list(
+                    getattr(self, name),
+                    default=default,
+                    allow_empty=True,
+                    allowed_sources=allowed.get(name),
+                ),
+            )
 
         # Keep scrape_sources as the union for crawler execution (canonically ordered).
         self.scrape_sources = self._compute_source_union(enabled_union)
@@ -359,66 +307,79 @@ class AppConfig:
 
     def _compute_source_union(self, enabled_union: list[str]) -> list[str]:
         """Compute the union of all per-field source lists, ordered canonically."""
-        union: list[str] = []
-        for s in (self.scrape_sources_fallback or []):
-            if s not in union:
-                union.append(s)
-        for lst in (
-            self.scrape_sources_title, self.scrape_sources_plot,
-            self.scrape_sources_actors, self.scrape_sources_tags,
-            self.scrape_sources_release, self.scrape_sources_runtime,
-            self.scrape_sources_directors, self.scrape_sources_series,
-            self.scrape_sources_studio, self.scrape_sources_publisher,
-            self.scrape_sources_trailer, self.scrape_sources_rating,
-            self.scrape_sources_want, self.scrape_sources_poster,
-            self.scrape_sources_fanart, self.scrape_sources_previews,
-        ):
-            for s in lst or []:
-                if s not in union:
-                    union.append(s)
-        for s in enabled_union:
-            if s not in union:
-                union.append(s)
+        # Only membership matters: the result follows _SOURCE_ORDER.
+        union = set(
+            chain(
+                self.scrape_sources_fallback or (),
+                *(getattr(self, name) or () for name, _ in _FIELD_SOURCE_DEFAULTS),
+                enabled_union,
+            )
+        )
         return [s for s in _SOURCE_ORDER if s in union]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary for serialization."""
-        return {k: v for k, v in self.__dict__.items()}
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+
+
+# Field names in declaration order (AppConfig has no per-instance __dict__).
+_FIELD_NAMES = tuple(f.name for f in fields(AppConfig))
 
 
 _config_lock = threading.Lock()
+# Last parsed config, keyed by (path, mtime_ns, size, inode) of config.json. Callers get
+# copies, so mutating a loaded config never leaks into the cache.
+_config_cache: tuple[tuple[str, int, int, int], AppConfig] | None = None
+
+
+def _copy_config(cfg: AppConfig) -> AppConfig:
+    """Shallow copy with fresh lists (the only mutable field values), skipping __post_init__."""
+    out = AppConfig.__new__(AppConfig)
+    for name in _FIELD_NAMES:
+        v = getattr(cfg, name)
+        setattr(out, name, list(v) if isinstance(v, list) else v)
+    return out
 
 
 def load_config() -> AppConfig:
+    global _config_cache
     with _config_lock:
-        if not CONFIG_PATH.exists():
+        try:
+            st = CONFIG_PATH.stat()
+        except OSError:
             return AppConfig()
+        key = (str(CONFIG_PATH), st.st_mtime_ns, st.st_size, st.st_ino)
+        if _config_cache is not None and _config_cache[0] == key:
+            return _copy_config(_config_cache[1])
         try:
-            data = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+            data = fastjson.loads(CONFIG_PATH.read_bytes())
         except Exception:
             return AppConfig()
 
         cfg = AppConfig()
         for k, v in data.items():
-            if hasattr(cfg, k):
+            if k in _FIELD_NAMES:
                 setattr(cfg, k, v)
         # Re-normalize after applying persisted values.
         try:
             cfg.__post_init__()
         except Exception:
             pass
-        return cfg
+        _config_cache = (key, cfg)
+        return _copy_config(cfg)
 
 
 def save_config(cfg: AppConfig) -> None:
-    content = json.dumps(cfg.__dict__, ensure_ascii=False, indent=4)
+    global _config_cache
+    content = fastjson.dumps_pretty(cfg.to_dict())
     with _config_lock:
+        _config_cache = None
         # Atomic write: temp file + os.replace to avoid partial writes
         parent = CONFIG_PATH.parent
         parent.mkdir(parents=True, exist_ok=True)
         fd, tmp_path = tempfile.mkstemp(dir=str(parent), suffix=".tmp")
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
+            with os.fdopen(fd, "wb") as f:
                 f.write(content)
             os.replace(tmp_path, str(CONFIG_PATH))
         except Exception:
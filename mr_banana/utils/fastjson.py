@@ -0,0 +1,47 @@
+"""
+JSON helpers that use orjson when it is installed (``pip install mr-banana[speedups]``).
+
+Every helper falls back to the stdlib ``json`` module, which also gets the final say on
+input orjson rejects (e.g. a UTF-8 BOM), so callers see the same results either way.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except Exception:
+            pass
+    return json.loads(data)
+
+
+def dumps_compact(obj: Any) -> str:
+    """Compact JSON with non-ASCII characters kept as-is."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except Exception:
+            # e.g. non-str dict keys or ints beyond 64 bits.
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Indented UTF-8 JSON (orjson only indents by 2 spaces; the stdlib path keeps 4)."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except Exception:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=4).encode("utf-8")
@@ -1,17 +1,118 @@
 """
 下载历史记录管理模块
 """
+import atexit
 import sqlite3
 import os
 import threading
+import weakref
 from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Optional, Generator
 
 # 数据库文件存放在项目根目录的 data/ 目录下
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data")
-os.makedirs(DATA_DIR, exist_ok=True)
-DB_FILE = os.path.join(DATA_DIR, "mr_banana_history.db")
+# abspath (not resolve) keeps the historical location when the package is symlinked.
+_DATA_PATH = Path(os.path.abspath(__file__)).parents[2] / "data"
+_DATA_PATH.mkdir(parents=True, exist_ok=True)
+DATA_DIR = str(_DATA_PATH)
+DB_FILE = str(_DATA_PATH / "mr_banana_history.db")
+
+
+def cache_path(filename: str) -> Path:
+    """On-disk cache file location: $MR_BANANA_CONFIG_DIR/cache, else data/cache."""
+    config_dir = os.environ.get("MR_BANANA_CONFIG_DIR", "")
+    base = Path(config_dir) if config_dir else _DATA_PATH
+    return base / "cache" / filename
+
+
+def _timestamp() -> str:
+    """Local time as stored in created_at/completed_at.
+
+    Same text sqlite3's (deprecated) default datetime adapter produced, built directly
+    so inserts skip the adapter lookup and stay comparable with existing rows.
+    """
+    return datetime.now().isoformat(" ")
+
+
+# Fixed-shape updates: NULL parameters leave the column unchanged.
+_UPDATE_TASK_SQL = """
+    UPDATE downloads SET
+        status = ?,
+        title = COALESCE(?, title),
+        error = COALESCE(?, error),
+        output_path = COALESCE(?, output_path),
+        scrape_after_download = COALESCE(?, scrape_after_download),
+        scrape_job_id = COALESCE(?, scrape_job_id),
+        scrape_status = COALESCE(?, scrape_status),
+        completed_at = COALESCE(?, completed_at)
+    WHERE id = ?
+"""
+_UPDATE_SCRAPE_SQL = """
+    UPDATE downloads SET
+        scrape_after_download = COALESCE(?, scrape_after_download),
+        scrape_job_id = COALESCE(?, scrape_job_id),
+        scrape_status = COALESCE(?, scrape_status)
+    WHERE id = ?
+"""
+
+# Columns added after the first release, with their declarations (migrated in _init_db).
+_MIGRATED_COLUMNS = {
+    "scrape_after_download": "INTEGER DEFAULT 0",
+    "scrape_job_id": "INTEGER",
+    "scrape_status": "TEXT",
+    "error": "TEXT",
+}
+
+
+class _ConnLocal(threading.local):
+    """Per-thread connection slot; ``conn`` starts as None in every thread."""
+
+    conn: Optional[sqlite3.Connection] = None
+
+
+# WAL makes synchronous=NORMAL crash-safe (only the last commits can roll back on power
+# loss) and it skips an fsync per commit on these small writes. cache_size and mmap_size are
+# upper bounds, not allocations: 20 MB page cache, 256 MB mmap window.
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA busy_timeout=30000;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+    PRAGMA mmap_size=268435456;
+"""
+
+
+class _Connection(sqlite3.Connection):
+    """sqlite3 connection that can be weakly referenced (the base type can't)."""
+
+
+# Every open connection of every HistoryManager, whichever thread opened it. Weak, so a
+# connection still goes away with its thread's local slot.
+_open_connections: "weakref.WeakSet[_Connection]" = weakref.WeakSet()
+_open_connections_lock = threading.Lock()
+
+
+def _optimize_and_close(conn: sqlite3.Connection) -> None:
+    """Refresh the planner statistics SQLite gathered on ``conn``, then close it."""
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+    finally:
+        conn.close()
+
+
+@atexit.register
+def _close_all_at_exit() -> None:
+    # Long-lived servers rarely close connections, so optimize all of them (worker
+    # threads' included) once at exit.
+    with _open_connections_lock:
+        conns = list(_open_connections)
+        _open_connections.clear()
+    for conn in conns:
+        _optimize_and_close(conn)
 
 
 class HistoryManager:
@@ -24,34 +125,49 @@ class HistoryManager:
         # Backward-compatible: if new DB doesn't exist but the old one does,
         # continue using the old file to preserve existing history.
         if db_path == DB_FILE and not os.path.exists(DB_FILE):
-            old_paths = [
+            old_paths = (
                 os.path.join(DATA_DIR, "banana_history.db"),
                 os.path.join(DATA_DIR, "mrjet_history.db"),
                 "banana_history.db",  # Legacy root-level paths
                 "mrjet_history.db",
                 "mr_banana_history.db",
-            ]
-            for old_path in old_paths:
-                if os.path.exists(old_path):
-                    db_path = old_path
-                    break
+            )
+            db_path = next((p for p in old_paths if os.path.exists(p)), db_path)
         self.db_path = db_path
-        self._local = threading.local()
+        self._local = _ConnLocal()
         self._lock = threading.Lock()
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
         """获取当前线程的数据库连接（线程安全）"""
-        if not hasattr(self._local, 'conn') or self._local.conn is None:
-            self._local.conn = sqlite3.connect(
+        conn = self._local.conn
+        if conn is None:
+            conn = sqlite3.connect(
                 self.db_path,
                 timeout=30.0,
-                check_same_thread=False
+                check_same_thread=False,
+                factory=_Connection,
             )
-            self._local.conn.row_factory = sqlite3.Row
-            self._local.conn.execute("PRAGMA journal_mode=WAL")
-            self._local.conn.execute("PRAGMA busy_timeout=30000")
-        return self._local.conn
+            conn.row_factory = sqlite3.Row
+            # One sqlite3_exec batch for the per-connection setup.
+            conn.executescript(_CONNECTION_PRAGMAS)
+            self._local.conn = conn
+            with _open_connections_lock:
+                _open_connections.add(conn)
+        return conn
+
+    def close(self) -> None:
+        """关闭当前线程的数据库连接
+
+        关闭前执行 ``PRAGMA optimize``，让 SQLite 按本连接的查询情况刷新索引统计信息。
+        """
+        conn = self._local.conn
+        if conn is None:
+            return
+        self._local.conn = None
+        with _open_connections_lock:
+            _open_connections.discard(conn)
+        _optimize_and_close(conn)
 
     @contextmanager
     def _db_connection(self) -> Generator[sqlite3.Connection, None, None]:
@@ -64,6 +180,15 @@ class HistoryManager:
             conn.rollback()
             raise
 
+    @contextmanager
+    def _write_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """上下文管理器：获取数据库连接并串行化本进程内的写入"""
+        # Writers queue on a Python lock instead of racing for SQLite's write lock and
+        # backing off in busy_timeout; readers never take it (WAL keeps them concurrent).
+        with self._lock:
+            with self._db_connection() as conn:
+                yield conn
+
     def _init_db(self):
         """初始化数据库"""
         with sqlite3.connect(self.db_path) as conn:
@@ -85,25 +210,30 @@ class HistoryManager:
             """)
 
             # Backward-compatible migrations for existing DBs.
-            cursor.execute("PRAGMA table_info(downloads)")
-            existing_cols = {row[1] for row in cursor.fetchall()}
-            if "scrape_after_download" not in existing_cols:
-                cursor.execute("ALTER TABLE downloads ADD COLUMN scrape_after_download INTEGER DEFAULT 0")
-            if "scrape_job_id" not in existing_cols:
-                cursor.execute("ALTER TABLE downloads ADD COLUMN scrape_job_id INTEGER")
-            if "scrape_status" not in existing_cols:
-                cursor.execute("ALTER TABLE downloads ADD COLUMN scrape_status TEXT")
-            if "error" not in existing_cols:
-                cursor.execute("ALTER TABLE downloads ADD COLUMN error TEXT")
+            # One lookup restricted to the migrated columns instead of the full table_info.
+            cursor.execute(
+                "SELECT name FROM pragma_table_info('downloads') WHERE name IN (%s)"
+                % ", ".join("?" * len(_MIGRATED_COLUMNS)),
+                tuple(_MIGRATED_COLUMNS),
+            )
+            existing_cols = {row[0] for row in cursor.fetchall()}
+            for col, decl in _MIGRATED_COLUMNS.items():
+                if col not in existing_cols:
+                    cursor.execute(f"ALTER TABLE downloads ADD COLUMN {col} {decl}")
+
+            # Lookup indexes: is_url_completed, get_url_by_output_path and get_history's ORDER BY.
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_downloads_url_status ON downloads(url, status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_downloads_output_path ON downloads(output_path)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_downloads_created_at ON downloads(created_at DESC)")
             conn.commit()
 
     def add_task(self, url: str, status: str = "排队中", *, scrape_after_download: bool = False) -> int:
         """添加下载任务"""
-        with self._db_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "INSERT INTO downloads (url, status, scrape_after_download, scrape_status, created_at) VALUES (?, ?, ?, ?, ?)",
-                (url, status, 1 if scrape_after_download else 0, "Pending" if scrape_after_download else None, datetime.now())
+                (url, status, 1 if scrape_after_download else 0, "Pending" if scrape_after_download else None, _timestamp())
             )
             return cursor.lastrowid
 
@@ -119,39 +249,33 @@ class HistoryManager:
         scrape_status: str = None,
     ):
         """更新任务状态"""
-        with self._db_connection() as conn:
-            cursor = conn.cursor()
-            updates = ["status = ?"]
-            params = [status]
-
-            if title:
-                updates.append("title = ?")
-                params.append(title)
-            if error is not None:
-                updates.append("error = ?")
-                params.append(error)
-            if output_path:
-                updates.append("output_path = ?")
-                params.append(output_path)
-
-            if scrape_after_download is not None:
-                updates.append("scrape_after_download = ?")
-                params.append(1 if bool(scrape_after_download) else 0)
-            if scrape_job_id is not None:
-                updates.append("scrape_job_id = ?")
-                params.append(scrape_job_id)
-            if scrape_status is not None:
-                updates.append("scrape_status = ?")
-                params.append(scrape_status)
-
-            if status in ["Completed", "Failed"]:
-                updates.append("completed_at = ?")
-                params.append(datetime.now())
-
-            params.append(task_id)
-
-            query = f"UPDATE downloads SET {', '.join(updates)} WHERE id = ?"
-            cursor.execute(query, params)
+        completed_at = _timestamp() if status in ("Completed", "Failed") else None
+        status_only = (
+            not title and error is None and not output_path and scrape_after_download is None
+            and scrape_job_id is None and scrape_status is None and completed_at is None
+        )
+        # One fixed statement for every combination of fields, so sqlite3's per-connection
+        # statement cache is reused; a NULL parameter keeps the column's current value.
+        with self._write_connection() as conn:
+            if status_only:
+                # Progress polling re-asserts the same status; skip the write (and its commit).
+                row = conn.execute("SELECT status FROM downloads WHERE id = ?", (task_id,)).fetchone()
+                if row is not None and row[0] == status:
+                    return
+            conn.execute(
+                _UPDATE_TASK_SQL,
+                (
+                    status,
+                    title or None,
+                    error,
+                    output_path or None,
+                    None if scrape_after_download is None else (1 if bool(scrape_after_download) else 0),
+                    scrape_job_id,
+                    scrape_status,
+                    completed_at,
+                    task_id,
+                ),
+            )
             conn.commit()
 
     def update_scrape(
@@ -163,27 +287,18 @@ class HistoryManager:
         scrape_status: str = None,
     ) -> None:
         """Update scrape-related fields without touching download status timestamps."""
-        with self._db_connection() as conn:
-            cursor = conn.cursor()
-            updates = []
-            params = []
-
-            if scrape_after_download is not None:
-                updates.append("scrape_after_download = ?")
-                params.append(1 if bool(scrape_after_download) else 0)
-            if scrape_job_id is not None:
-                updates.append("scrape_job_id = ?")
-                params.append(scrape_job_id)
-            if scrape_status is not None:
-                updates.append("scrape_status = ?")
-                params.append(scrape_status)
-
-            if not updates:
-                return
-
-            params.append(task_id)
-            query = f"UPDATE downloads SET {', '.join(updates)} WHERE id = ?"
-            cursor.execute(query, params)
+        if scrape_after_download is None and scrape_job_id is None and scrape_status is None:
+            return
+        with self._write_connection() as conn:
+            conn.execute(
+                _UPDATE_SCRAPE_SQL,
+                (
+                    None if scrape_after_download is None else (1 if bool(scrape_after_download) else 0),
+                    scrape_job_id,
+                    scrape_status,
+                    task_id,
+                ),
+            )
             conn.commit()
 
     def get_task(self, task_id: int) -> Optional[Dict]:
@@ -196,7 +311,7 @@ class HistoryManager:
 
     def delete_task(self, task_id: int) -> None:
         """删除任务记录"""
-        with self._db_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM downloads WHERE id = ?", (task_id,))
 
@@ -230,12 +345,17 @@ class HistoryManager:
             seen.add(c)
             uniq.append(c)
 
+        if not uniq:
+            return None
+        # At most three candidates (as given / absolute / relative): pad by repeating the
+        # last one so every lookup runs the same cached statement.
+        params = (uniq + [uniq[-1]] * 3)[:3]
+
         with self._db_connection() as conn:
             cursor = conn.cursor()
-            placeholders = ",".join(["?"] * len(uniq))
             cursor.execute(
-                f"SELECT url FROM downloads WHERE output_path IN ({placeholders}) ORDER BY id DESC LIMIT 1",
-                tuple(uniq),
+                "SELECT url FROM downloads WHERE output_path IN (?, ?, ?) ORDER BY id DESC LIMIT 1",
+                params,
             )
             row = cursor.fetchone()
             return row[0] if row else None
@@ -248,7 +368,7 @@ class HistoryManager:
         Returns:
             int: 被更新的行数
         """
-        with self._db_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -277,7 +397,7 @@ class HistoryManager:
         Returns:
             int: number of deleted rows (best-effort)
         """
-        with self._db_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM downloads")
             deleted = int(cursor.rowcount or 0)
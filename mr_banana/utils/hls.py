@@ -1,27 +1,93 @@
 """
 HLS 视频下载模块 - 支持并发下载 m3u8 视频流
 """
+import math
 import os
 import shutil
 import time
 import m3u8
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from urllib.parse import urljoin
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urljoin, urlsplit
 from mr_banana.utils.logger import logger
 from mr_banana.utils.network import NetworkHandler
 
 
+_SIZE_UNITS = ("", "K", "M", "G", "T")
+
+
 class DownloadCancelled(Exception):
     pass
 
 
+def _make_uri_resolver(base_uri: str):
+    """Return a resolver for playlist URIs relative to ``base_uri``.
+
+    Segment URIs are almost always plain names (``seg_001.ts``) or host-absolute paths, which
+    are joined by concatenation; anything with dot segments, schemes, queries on the base, etc.
+    goes through urljoin so results match it exactly.
+    """
+    parts = urlsplit(base_uri)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    # Concatenation is only used when it provably matches urljoin for this base
+    # (no query/params, no empty or dot path segments that urljoin would normalize).
+    simple_base = (
+        not (parts.query or parts.fragment or ";" in base_uri)
+        and urljoin(base_uri, "x") == base_uri + "x"
+        and urljoin(base_uri, "/x") == origin + "/x"
+    )
+
+    def resolve(uri: str) -> str:
+        if uri.startswith(("http://", "https://")):
+            return uri
+        if simple_base and uri.isprintable() and uri.strip() == uri and "#" not in uri:
+            path, sep, query = uri.partition("?")
+            if (
+                path
+                and not (sep and not query)
+                and ":" not in path
+                and ";" not in path
+                and "//" not in path
+                and "/./" not in f"/{path}/"
+                and "/../" not in f"/{path}/"
+            ):
+                return origin + uri if path[0] == "/" else base_uri + uri
+        return urljoin(base_uri, uri)
+
+    return resolve
+
+
+def _copy_fd(in_fd: int, out_fd: int, size: int) -> None:
+    """Append ``size`` bytes of ``in_fd`` to ``out_fd``, via sendfile where the OS allows it."""
+    offset = 0
+    if hasattr(os, "sendfile"):
+        try:
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            # e.g. macOS, where sendfile needs a socket: finish with a plain copy.
+            pass
+    if offset < size:
+        os.lseek(in_fd, offset, os.SEEK_SET)
+        while True:
+            buf = os.read(in_fd, 1024 * 1024)
+            if not buf:
+                break
+            os.write(out_fd, buf)
+
+
 class HLSDownloader:
     """HLS (m3u8) 视频下载器"""
 
     def __init__(self, network_handler: NetworkHandler, max_workers: int = 16):
         self.network = network_handler
         self.max_workers = max_workers
+        # (master URL, preferred resolution) -> selected variant URL, so a resumed download
+        # goes straight to the media playlist instead of refetching and re-ranking the master.
+        self._variant_cache: dict[tuple[str, str | None], str] = {}
 
     def download(
         self,
@@ -46,6 +112,9 @@ class HLSDownloader:
         if cancel_event and cancel_event.is_set():
             raise DownloadCancelled()
 
+        # DNS pins are reused within one download only; re-resolve each origin per download.
+        self.network.clear_resolved_hosts()
+
         def _parse_target_height(pref: str | None) -> int | None:
             if not pref:
                 return None
@@ -110,7 +179,21 @@ class HLSDownloader:
         # 获取 m3u8 内容（若是 master playlist，则按分辨率选择 variant）
         playlist = None
         content = None
-        for _ in range(2):
+        variant_key = (m3u8_url, preferred_resolution)
+        cached_variant = self._variant_cache.get(variant_key)
+        if cached_variant:
+            content = self.network.get(cached_variant, headers=headers)
+            if cancel_event and cancel_event.is_set():
+                raise DownloadCancelled()
+            if content:
+                playlist = m3u8.loads(content)
+            if playlist is not None and playlist.segments:
+                m3u8_url = cached_variant
+            else:
+                # Stale (e.g. expired token): drop it and resolve from the master again.
+                self._variant_cache.pop(variant_key, None)
+                playlist = None
+        for _ in range(0 if playlist is not None else 2):
             content = self.network.get(m3u8_url, headers=headers)
             if not content:
                 logger.error("Failed to fetch m3u8 playlist")
@@ -127,6 +210,7 @@ class HLSDownloader:
             base_uri = m3u8_url.rsplit('/', 1)[0] + '/'
             variant_url = _select_variant_url(playlist, base_uri)
             if variant_url:
+                self._variant_cache[variant_key] = variant_url
                 m3u8_url = variant_url
                 continue
             break
@@ -145,28 +229,18 @@ class HLSDownloader:
 
         try:
             base_uri = m3u8_url.rsplit('/', 1)[0] + '/'
+            resolve_uri = _make_uri_resolver(base_uri)
 
-            # 下载加密密钥（如果存在）
-            for key in playlist.keys:
-                if key and key.uri:
-                    if not key.uri.startswith(('http://', 'https://')):
-                        key.uri = urljoin(base_uri, key.uri)
-
-                    key_content = self.network.download_file(key.uri, headers=headers)
-                    if key_content:
-                        key_filename = "key.key"
-                        with open(os.path.join(temp_dir, key_filename), "wb") as f:
-                            f.write(key_content)
-                        key.uri = key_filename
+            # 加密密钥（如果存在）与第一批分段一起在线程池中下载，合并前再落盘
+            keys = [key for key in playlist.keys if key and key.uri]
+            for key in keys:
+                key.uri = resolve_uri(key.uri)
 
             # 并发下载分段
             segments_to_download = []
             for i, segment in enumerate(playlist.segments):
-                if not segment.uri.startswith(('http://', 'https://')):
-                    segment.uri = urljoin(base_uri, segment.uri)
-
                 filename = f"seg_{i:05d}.ts"
-                segments_to_download.append((segment.uri, os.path.join(temp_dir, filename)))
+                segments_to_download.append((resolve_uri(segment.uri), os.path.join(temp_dir, filename)))
                 segment.uri = filename
 
             logger.info(f"Downloading {len(segments_to_download)} segments with {self.max_workers} workers...")
@@ -177,6 +251,10 @@ class HLSDownloader:
 
             executor = ThreadPoolExecutor(max_workers=self.max_workers)
             cancelled = False
+            key_futures = [
+                (key, executor.submit(self.network.download_file, key.uri, headers=headers))
+                for key in keys
+            ]
             try:
                 completed_count = 0
                 total_count = len(segments_to_download)
@@ -210,36 +288,36 @@ class HLSDownloader:
                             fut.cancel()
                         raise DownloadCancelled()
 
-                    # 取一个完成的 future
-                    try:
-                        future = next(as_completed(pending, timeout=0.2))
-                    except TimeoutError:
+                    # 一次取出所有已完成的 future；超时只用于定期检查取消
+                    done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                    if not done:
                         continue
 
-                    pending.remove(future)
-                    url, path = future_to_item.pop(future, (None, None))
-
-                    try:
-                        size = future.result()
-                        if size > 0:
-                            total_bytes += size
-                            completed_count += 1
-                        else:
+                    for future in done:
+                        url, path = future_to_item.pop(future, (None, None))
+                        try:
+                            size = future.result()
+                            if size > 0:
+                                total_bytes += size
+                                completed_count += 1
+                            else:
+                                failed_segments.append((url, path))
+                        except DownloadCancelled:
+                            cancelled = True
+                            raise
+                        except Exception as e:
+                            logger.error(f"Segment download error: {e}")
                             failed_segments.append((url, path))
-                    except DownloadCancelled:
-                        cancelled = True
-                        raise
-                    except Exception as e:
-                        logger.error(f"Segment download error: {e}")
-                        failed_segments.append((url, path))
 
-                    # 补充提交
+                    # 补充提交（每个完成的 future 补一个）
                     if cancel_event and cancel_event.is_set():
                         cancelled = True
                         for fut in pending:
                             fut.cancel()
                         raise DownloadCancelled()
-                    submit_next()
+                    for _ in range(len(done)):
+                        if not submit_next():
+                            break
 
                     # 更新进度
                     elapsed = time.time() - start_time
@@ -257,6 +335,14 @@ class HLSDownloader:
             if cancel_event and cancel_event.is_set():
                 raise DownloadCancelled()
 
+            for key, fut in key_futures:
+                key_content = fut.result()
+                if key_content:
+                    key_filename = "key.key"
+                    with open(os.path.join(temp_dir, key_filename), "wb") as f:
+                        f.write(key_content)
+                    key.uri = key_filename
+
             # 重试失败的分段
             if failed_segments:
                 logger.warning(f"{len(failed_segments)} segments failed; retrying...")
@@ -288,7 +374,11 @@ class HLSDownloader:
             if cancel_event and cancel_event.is_set():
                 raise DownloadCancelled()
 
-            self._merge_with_ffmpeg(local_m3u8_path, output_path)
+            if not keys and not getattr(playlist, "segment_map", None) and output_path.lower().endswith(".ts"):
+                # Unencrypted MPEG-TS into a .ts file: concatenation is the whole merge.
+                self._merge_concat([p for _, p in segments_to_download], output_path)
+            else:
+                self._merge_with_ffmpeg(local_m3u8_path, output_path)
 
             return True
 
@@ -298,20 +388,34 @@ class HLSDownloader:
             logger.error(f"HLS download failed: {e}")
             return False
         finally:
-            # 清理临时文件
+            # 清理临时文件（取消时仍在运行的 worker 可能还在写入，不让清理失败掩盖原异常）
             if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+                shutil.rmtree(temp_dir, ignore_errors=True)
 
     def _download_segment(self, url: str, path: str, cancel_event=None, headers: dict[str, str] | None = None) -> int:
         """下载单个分段"""
         if cancel_event and cancel_event.is_set():
             raise DownloadCancelled()
-        content = self.network.download_file(url, headers=headers)
-        if content:
-            with open(path, "wb") as f:
-                f.write(content)
-            return len(content)
-        return 0
+        # Streamed straight to disk: no per-worker copy of the whole segment in memory.
+        return self.network.stream_to_file(url, path, headers=headers)
+
+    def _merge_concat(self, segment_paths: list[str], output_path: str):
+        """按顺序直接拼接 TS 分段（内核态拷贝，不经过 ffmpeg）"""
+        out_fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            for path in segment_paths:
+                try:
+                    in_fd = os.open(path, os.O_RDONLY)
+                except FileNotFoundError:
+                    # Same as ffmpeg's HLS demuxer: a segment that never arrived is skipped.
+                    logger.warning(f"Missing segment skipped: {os.path.basename(path)}")
+                    continue
+                try:
+                    _copy_fd(in_fd, out_fd, os.fstat(in_fd).st_size)
+                finally:
+                    os.close(in_fd)
+        finally:
+            os.close(out_fd)
 
     def _merge_with_ffmpeg(self, m3u8_path: str, output_path: str):
         """使用 FFmpeg 合并分段"""
@@ -329,10 +433,7 @@ class HLSDownloader:
 
     def _format_bytes(self, size: float) -> str:
         """格式化字节数"""
-        power = 2**10
-        n = 0
-        power_labels = {0: '', 1: 'K', 2: 'M', 3: 'G', 4: 'T'}
-        while size > power:
-            size /= power
-            n += 1
-        return f"{size:.2f} {power_labels[n]}B"
\ No newline at end of file
+        # Unit index from the bit length: one step per 2**10 strictly exceeded, as the
+        # divide-while-larger loop this replaces did (1024 stays "1024.00 B").
+        n = min(((math.ceil(size) - 1).bit_length() - 1) // 10, 4) if size > 1 else 0
+        return f"{size / (1 << (10 * n)):.2f} {_SIZE_UNITS[n]}B"
\ No newline at end of file
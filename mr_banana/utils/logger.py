@@ -44,6 +44,11 @@ def set_task_id(task_id: int | str | None) -> None:
     _task_ctx.task_id = str(task_id)
 
 
+def get_task_id() -> str | None:
+    """Return current thread's task id (None when unset)."""
+    return getattr(_task_ctx, "task_id", None)
+
+
 def clear_task_id() -> None:
     """Clear current thread's task id for log routing."""
     if hasattr(_task_ctx, "task_id"):
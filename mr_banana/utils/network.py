@@ -3,6 +3,7 @@
 """
 from __future__ import annotations
 
+import os
 import socket
 import time
 from typing import Optional, Dict, Any
@@ -22,6 +23,9 @@ WINDOWS_USER_AGENT = (
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
 )
 
+# Read size for streamed downloads (HLS segments are written to disk chunk by chunk).
+_STREAM_CHUNK = 64 * 1024
+
 
 def _system_resolve(url: str) -> list[bytes]:
     """Pre-resolve hostname using system DNS for curl_cffi c-ares compatibility.
@@ -54,13 +58,29 @@ def apply_curl_dns_resolve(session: requests.Session, url: str) -> None:
     if not entries:
         return
     existing = session.curl_options.get(CurlOpt.RESOLVE, [])
-    new_host_prefix = entries[0].split(b":")[0] + b":"
-    # Replace existing entry for the same host, keep others
+    host, port, _ = entries[0].split(b":", 2)
+    new_host_prefix = host + b":" + port + b":"
+    # Replace existing entry for the same host:port, keep others
     updated = [e for e in existing if not e.startswith(new_host_prefix)]
     updated.extend(entries)
     session.curl_options[CurlOpt.RESOLVE] = updated
 
 
+def tls_verify() -> bool | str:
+    """TLS verification setting for curl_cffi sessions.
+
+    Defaults to the bundled CA store. ``MR_BANANA_CA_BUNDLE`` may point to a PEM
+    file for hosts signed by a private CA (e.g. a MITM proxy), or be set to
+    "0"/"false" to turn verification off entirely.
+    """
+    bundle = os.environ.get("MR_BANANA_CA_BUNDLE", "").strip()
+    if not bundle:
+        return True
+    if bundle.lower() in ("0", "false", "no", "off"):
+        return False
+    return bundle
+
+
 def build_proxies(proxy_url: str | None) -> dict[str, str] | None:
     """Build a proxies dict from a single proxy URL string.
 
@@ -89,7 +109,20 @@ class NetworkHandler:
         self.headers = {
             "User-Agent": WINDOWS_USER_AGENT,
         }
-        self._session = requests.Session()
+        # One session for every request: curl_cffi keeps a connection cache per worker thread,
+        # so repeated requests to a host reuse its TLS connection. Request defaults live on
+        # the session; per-call headers are merged over self.headers by curl_cffi.
+        self._session = requests.Session(
+            headers=self.headers,
+            timeout=timeout,
+            verify=False,
+            proxies=proxies,
+            impersonate="chrome",
+        )
+        # Hosts already pinned in the session's CURLOPT_RESOLVE list. Segment storms hit one
+        # origin hundreds of times; resolving once keeps every request on the warm connections.
+        # Callers clear it per download (clear_resolved_hosts) so CDN IP rotation is picked up.
+        self._resolved_hosts: set[str] = set()
         proxy_url = None
         try:
             if proxies:
@@ -98,6 +131,18 @@ class NetworkHandler:
             proxy_url = None
         self.browser_manager = BrowserManager(proxy_url=proxy_url)
 
+    def _resolve_once(self, url: str) -> None:
+        """Pin the system-resolved address for url's host the first time it is seen."""
+        host = urlparse(url).netloc
+        if host in self._resolved_hosts:
+            return
+        apply_curl_dns_resolve(self._session, url)
+        self._resolved_hosts.add(host)
+
+    def clear_resolved_hosts(self) -> None:
+        """Forget pinned hosts; the next request to each host resolves it again."""
+        self._resolved_hosts.clear()
+
     def get(self, url: str, use_browser: bool = False, headers: Optional[Dict[str, str]] = None) -> Optional[str]:
         """
         GET 请求
@@ -113,20 +158,10 @@ class NetworkHandler:
 
     def _get_with_requests(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[str]:
         """使用 requests 发起请求"""
-        apply_curl_dns_resolve(self._session, url)
+        self._resolve_once(url)
         for attempt in range(self.retry):
             try:
-                merged_headers = dict(self.headers)
-                if headers:
-                    merged_headers.update(headers)
-                response = self._session.get(
-                    url=url,
-                    headers=merged_headers,
-                    timeout=self.timeout,
-                    verify=False,
-                    proxies=self.proxies,
-                    impersonate="chrome"
-                )
+                response = self._session.get(url=url, headers=headers)
                 if response.status_code == 200:
                     return response.text
                 logger.warning(f"HTTP {response.status_code}: {url}")
@@ -148,23 +183,51 @@ class NetworkHandler:
 
     def download_file(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[bytes]:
         """下载二进制文件"""
-        apply_curl_dns_resolve(self._session, url)
+        self._resolve_once(url)
         for attempt in range(self.retry):
             try:
-                merged_headers = dict(self.headers)
-                if headers:
-                    merged_headers.update(headers)
-                response = self._session.get(
-                    url=url,
-                    headers=merged_headers,
-                    timeout=self.timeout,
-                    verify=False,
-                    proxies=self.proxies,
-                    impersonate="chrome"
-                )
+                response = self._session.get(url=url, headers=headers)
                 if response.status_code == 200:
                     return response.content
             except Exception as e:
                 logger.warning(f"Download failed {url}: {e}")
                 time.sleep(self.delay)
-        return None
\ No newline at end of file
+        return None
+
+    def stream_to_file(self, url: str, path: str, headers: Optional[Dict[str, str]] = None) -> int:
+        """下载二进制文件并直接流式写入磁盘
+
+        Body 先写入 ``path + ".part"``，完整后再替换 ``path``，失败不会留下半截文件。
+
+        Returns:
+            int: 写入的字节数；失败或空响应返回 0
+        """
+        self._resolve_once(url)
+        tmp = path + ".part"
+        for attempt in range(self.retry):
+            try:
+                response = self._session.get(url=url, headers=headers, stream=True)
+                try:
+                    if response.status_code != 200:
+                        continue
+                    size = 0
+                    with open(tmp, "wb") as f:
+                        for chunk in response.iter_content(chunk_size=_STREAM_CHUNK):
+                            if chunk:
+                                f.write(chunk)
+                                size += len(chunk)
+                finally:
+                    response.close()
+                if size:
+                    os.replace(tmp, path)
+                else:
+                    os.remove(tmp)
+                return size
+            except Exception as e:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                logger.warning(f"Download failed {url}: {e}")
+                time.sleep(self.delay)
+        return 0
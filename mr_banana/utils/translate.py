@@ -30,6 +30,152 @@ def _deepl_lang(lang: str) -> str:
     }.get(lang, "ZH-HANS")
 
 
+# Providers whose API accepts a list of strings per request, and the per-request cap
+# (DeepL allows 50 ``text`` values; the Edge endpoint 100 array elements).
+_BATCH_PROVIDERS = frozenset({"deepl", "microsoft"})
+_BATCH_MAX_TEXTS = 50
+
+
+def _translate_deepl(requests, texts, target, base_url, api_key, proxies, timeout_sec) -> list:
+    """Translate ``texts`` in one DeepL request; failed entries come back unchanged."""
+    key = str(api_key or "").strip()
+    if not key:
+        logger.warning("translate deepl: missing api key; skip")
+        return list(texts)
+    try:
+        # DeepL uses a different host for free keys (ending with :fx).
+        host = "https://api-free.deepl.com" if key.endswith(":fx") else "https://api.deepl.com"
+        url = (base_url or "").strip().rstrip("/") or host
+        # Repeated ``text`` fields; translations come back in the same order.
+        form = [("auth_key", key), *(("text", t) for t in texts), ("target_lang", _deepl_lang(target))]
+        resp = requests.post(
+            url=f"{url}/v2/translate",
+            data=form,
+            timeout=timeout_sec,
+            verify=False,
+            impersonate="chrome",
+            proxies=proxies,
+        )
+        if resp.status_code != 200:
+            logger.warning(f"translate deepl http={resp.status_code}")
+            return list(texts)
+        data = resp.json() if hasattr(resp, "json") else {}
+        translations = (data or {}).get("translations")
+        out = list(texts)
+        if isinstance(translations, list):
+            for i, tr in enumerate(translations[: len(out)]):
+                if isinstance(tr, dict) and tr.get("text"):
+                    out[i] = tr.get("text")
+        return out
+    except Exception as e:
+        logger.warning(f"translate deepl failed: {e}")
+        return list(texts)
+
+
+def _translate_microsoft(requests, texts, target, proxies, timeout_sec) -> list:
+    """Translate ``texts`` in one Edge translator request; failed entries come back unchanged."""
+    # Best-effort endpoint used by Edge; may change over time.
+    try:
+        url = "https://api-edge.cognitive.microsofttranslator.com/translate?api-version=3.0"
+        url += f"&to={quote(target)}"
+        resp = requests.post(
+            url=url,
+            json=[{"Text": t} for t in texts],
+            headers={
+                "accept": "application/json",
+                "content-type": "application/json",
+                "user-agent": "Mozilla/5.0",
+            },
+            timeout=timeout_sec,
+            verify=False,
+            impersonate="chrome",
+            proxies=proxies,
+        )
+        if resp.status_code != 200:
+            logger.warning(f"translate microsoft http={resp.status_code}")
+            return list(texts)
+        data = resp.json() if hasattr(resp, "json") else None
+        out = list(texts)
+        if isinstance(data, list):
+            for i, item in enumerate(data[: len(out)]):
+                translations = (item or {}).get("translations")
+                if isinstance(translations, list) and translations:
+                    text = (translations[0] or {}).get("text")
+                    if text:
+                        out[i] = text
+        return out
+    except Exception as e:
+        logger.warning(f"translate microsoft failed: {e}")
+        return list(texts)
+
+
+def supports_batch(provider: str) -> bool:
+    """Whether ``translate_text_batch`` sends one request for many texts with this provider."""
+    return (provider or "google").strip().lower() in _BATCH_PROVIDERS
+
+
+def translate_text_batch(
+    texts: list[str],
+    *,
+    target_lang: str,
+    provider: str = "google",
+    base_url: str = "",
+    api_key: str = "",
+    email: str = "",
+    proxy_url: str = "",
+    timeout_sec: float = 15.0,
+) -> list[str]:
+    """Translate many strings, returning results in input order.
+
+    DeepL and Microsoft take the whole list in a single request. Google's
+    unauthenticated endpoint has no batch form, so it falls back to one
+    ``translate_text`` call per string. Failed entries come back unchanged.
+    """
+    texts = list(texts)
+    provider = (provider or "google").strip().lower()
+    if provider not in _BATCH_PROVIDERS:
+        return [
+            translate_text(
+                t,
+                target_lang=target_lang,
+                provider=provider,
+                base_url=base_url,
+                api_key=api_key,
+                email=email,
+                proxy_url=proxy_url,
+                timeout_sec=timeout_sec,
+            )
+            for t in texts
+        ]
+
+    # Empty strings are returned as-is and never sent.
+    idx = [i for i, t in enumerate(texts) if t]
+    if not idx:
+        return texts
+
+    try:
+        from curl_cffi import requests  # type: ignore
+    except Exception:
+        logger.warning("translate: curl_cffi not available; skip")
+        return texts
+
+    from mr_banana.utils.network import build_proxies
+    proxies = build_proxies(proxy_url)
+    target = _normalize_target_lang(target_lang)
+    todo = [texts[i] for i in idx]
+
+    out = list(texts)
+    for start in range(0, len(todo), _BATCH_MAX_TEXTS):
+        chunk = todo[start : start + _BATCH_MAX_TEXTS]
+        if provider == "deepl":
+            done = _translate_deepl(requests, chunk, target, base_url, api_key, proxies, timeout_sec)
+        else:
+            done = _translate_microsoft(requests, chunk, target, proxies, timeout_sec)
+        for j, t in enumerate(done):
+            out[idx[start + j]] = t
+    return out
+
+
 def translate_text(
     text: str | None,
     *,
@@ -67,72 +213,10 @@ def translate_text(
     proxies = build_proxies(proxy_url)
 
     if provider == "deepl":
-        key = str(api_key or "").strip()
-        if not key:
-            logger.warning("translate deepl: missing api key; skip")
-            return text
-        try:
-            # DeepL uses a different host for free keys (ending with :fx).
-            host = "https://api-free.deepl.com" if key.endswith(":fx") else "https://api.deepl.com"
-            url = (base_url or "").strip().rstrip("/") or host
-            resp = requests.post(
-                url=f"{url}/v2/translate",
-                data={
-                    "auth_key": key,
-                    "text": text,
-                    "target_lang": _deepl_lang(target),
-                },
-                timeout=timeout_sec,
-                verify=False,
-                impersonate="chrome",
-                proxies=proxies,
-            )
-            if resp.status_code != 200:
-                logger.warning(f"translate deepl http={resp.status_code}")
-                return text
-            data = resp.json() if hasattr(resp, "json") else {}
-            translations = (data or {}).get("translations")
-            if isinstance(translations, list) and translations:
-                t0 = translations[0]
-                if isinstance(t0, dict):
-                    out = t0.get("text")
-                    return out or text
-            return text
-        except Exception as e:
-            logger.warning(f"translate deepl failed: {e}")
-            return text
+        return _translate_deepl(requests, [text], target, base_url, api_key, proxies, timeout_sec)[0]
 
     if provider == "microsoft":
-        # Best-effort endpoint used by Edge; may change over time.
-        try:
-            url = "https://api-edge.cognitive.microsofttranslator.com/translate?api-version=3.0"
-            url += f"&to={quote(target)}"
-            resp = requests.post(
-                url=url,
-                json=[{"Text": text}],
-                headers={
-                    "accept": "application/json",
-                    "content-type": "application/json",
-                    "user-agent": "Mozilla/5.0",
-                },
-                timeout=timeout_sec,
-                verify=False,
-                impersonate="chrome",
-                proxies=proxies,
-            )
-            if resp.status_code != 200:
-                logger.warning(f"translate microsoft http={resp.status_code}")
-                return text
-            data = resp.json() if hasattr(resp, "json") else None
-            if isinstance(data, list) and data:
-                translations = (data[0] or {}).get("translations")
-                if isinstance(translations, list) and translations:
-                    out = (translations[0] or {}).get("text")
-                    return out or text
-            return text
-        except Exception as e:
-            logger.warning(f"translate microsoft failed: {e}")
-            return text
+        return _translate_microsoft(requests, [text], target, proxies, timeout_sec)[0]
 
     # Default: google
     try:
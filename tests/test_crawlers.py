@@ -41,6 +41,15 @@ class TestExtractJavCode:
     def test_long_code(self):
         assert extract_jav_code(Path("WAAA-585.mp4")) == "WAAA-585"
 
+    def test_skips_non_code_hyphens(self):
+        assert extract_jav_code(Path("[Studio]ABCDEF-GHIJ.ABC-123.mp4")) == "ABC-123"
+
+    def test_letter_run_too_long(self):
+        assert extract_jav_code(Path("ABCDEFG-123.mp4")) is None
+
+    def test_digit_run_too_long(self):
+        assert extract_jav_code(Path("ADN-123456.mp4")) is None
+
 
 class TestNormalizeJableInput:
     """Test URL normalization for Jable.tv."""
@@ -0,0 +1,52 @@
+"""
+Tests for the orjson-or-stdlib JSON helpers; every case runs on both paths.
+"""
+import json
+
+import pytest
+
+from mr_banana.utils import fastjson
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        monkeypatch.setattr(fastjson, "HAS_ORJSON", True)
+    else:
+        monkeypatch.setattr(fastjson, "HAS_ORJSON", False)
+    return request.param
+
+
+SAMPLE = {"title": "标题 ✓", "n": 3, "f": 1.5, "none": None, "list": [1, "a", True]}
+
+
+class TestLoads:
+    def test_bytes_and_str(self, backend):
+        raw = json.dumps(SAMPLE, ensure_ascii=False)
+        assert fastjson.loads(raw) == SAMPLE
+        assert fastjson.loads(raw.encode("utf-8")) == SAMPLE
+
+    def test_utf8_bom_falls_back_to_stdlib_rules(self, backend):
+        raw = "\ufeff" + json.dumps(SAMPLE)
+        with pytest.raises(json.JSONDecodeError):
+            fastjson.loads(raw)
+
+    def test_invalid_utf8_raises_unicode_error(self, backend):
+        with pytest.raises(UnicodeDecodeError):
+            fastjson.loads(b'{"a": "\xff"}')
+
+
+class TestDumps:
+    def test_compact_matches_stdlib(self, backend):
+        expected = json.dumps(SAMPLE, ensure_ascii=False, separators=(",", ":"))
+        assert fastjson.dumps_compact(SAMPLE) == expected
+
+    def test_compact_non_str_keys(self, backend):
+        assert json.loads(fastjson.dumps_compact({1: "a"})) == {"1": "a"}
+
+    def test_pretty_round_trips(self, backend):
+        out = fastjson.dumps_pretty(SAMPLE)
+        assert isinstance(out, bytes)
+        assert b"\n" in out
+        assert json.loads(out) == SAMPLE
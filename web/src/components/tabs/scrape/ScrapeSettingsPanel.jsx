@@ -238,6 +238,14 @@ function DownloadOptionsTab({ tr }) {
                     />
                     {tr('scrape.download.subtitle')}
                 </label>
+                <label className="flex items-center gap-2 text-sm">
+                    <input
+                        type="checkbox"
+                        checked={Boolean(config.scrape_skip_existing_artwork)}
+                        onChange={(e) => setConfig({ scrape_skip_existing_artwork: e.target.checked })}
+                    />
+                    {tr('scrape.download.skipExisting')}
+                </label>
             </div>
 
             <label className="grid gap-2 text-sm max-w-xs">
@@ -253,6 +253,7 @@ export const UI_TEXT = {
         'scrape.download.previews': '剧照',
         'scrape.download.trailer': '预告片',
         'scrape.download.subtitle': '字幕',
+        'scrape.download.skipExisting': '保留已下载的图片',
         'scrape.download.previewLimit': '剧照数量上限',
 
         'scrape.nfo.generate': '生成 NFO',
@@ -594,6 +595,7 @@ export const UI_TEXT = {
         'scrape.download.previews': '劇照',
         'scrape.download.subtitle': '字幕',
         'scrape.download.trailer': '預告片',
+        'scrape.download.skipExisting': '保留已下載的圖片',
         'scrape.download.previewLimit': '劇照數量上限',
 
         'scrape.nfo.generate': '產生 NFO',
@@ -951,6 +953,7 @@ export const UI_TEXT = {
         'scrape.download.previews': 'Previews',
         'scrape.download.trailer': 'Trailer',
         'scrape.download.subtitle': 'Subtitle',
+        'scrape.download.skipExisting': 'Keep existing artwork',
         'scrape.download.previewLimit': 'Preview limit',
 
         'scrape.nfo.generate': 'Write NFO',
@@ -55,6 +55,7 @@ export const DEFAULT_SCRAPE_CONFIG = {
     scrape_download_previews: true,
     scrape_download_trailer: true,
     scrape_download_subtitle: true,
+    scrape_skip_existing_artwork: false,
     scrape_preview_limit: 8,
     scrape_write_nfo: true,
     scrape_nfo_fields: [